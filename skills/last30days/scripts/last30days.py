@@ -11,9 +11,13 @@ import os
 import re
 import signal
 import sys
-import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 MIN_PYTHON = (3, 12)
 
 
@@ -43,24 +47,21 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib import env, pipeline, render, schema, ui
 
+# set.add/discard/copy are single atomic operations under the GIL, so no lock
+# is needed; cleanup iterates a snapshot in case a worker is still registering.
 _child_pids: set[int] = set()
-_child_pids_lock = threading.Lock()
 
 
 def register_child_pid(pid: int) -> None:
-    with _child_pids_lock:
-        _child_pids.add(pid)
+    _child_pids.add(pid)
 
 
 def unregister_child_pid(pid: int) -> None:
-    with _child_pids_lock:
-        _child_pids.discard(pid)
+    _child_pids.discard(pid)
 
 
 def _cleanup_children() -> None:
-    with _child_pids_lock:
-        pids = list(_child_pids)
-    for pid in pids:
+    for pid in _child_pids.copy():
         try:
             os.killpg(os.getpgid(pid), signal.SIGTERM)
         except (ProcessLookupError, PermissionError, OSError):
@@ -112,9 +113,19 @@ def save_output(report: schema.Report, emit: str, save_dir: str, suffix: str = "
     return out_path
 
 
+def dumps_pretty_json(payload: object) -> str:
+    """Serialize to indented, key-sorted JSON; orjson when installed, stdlib otherwise."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys or big ints; stdlib handles those
+    return json.dumps(payload, indent=2, sort_keys=True)
+
+
 def emit_output(report: schema.Report, emit: str, fun_level: str = "medium", save_path: str | None = None) -> str:
     if emit == "json":
-        return json.dumps(schema.to_dict(report), indent=2, sort_keys=True)
+        return dumps_pretty_json(schema.to_dict(report))
     if emit in {"compact", "md"}:
         return render.render_compact(report, fun_level=fun_level, save_path=save_path)
     if emit == "context":
@@ -137,7 +148,7 @@ def emit_comparison_output(
                 for label, report in entity_reports
             ],
         }
-        return json.dumps(payload, indent=2, sort_keys=True)
+        return dumps_pretty_json(payload)
     if emit in {"compact", "md"}:
         return render.render_comparison_multi(
             entity_reports, fun_level=fun_level, save_path=save_path,
@@ -530,7 +541,7 @@ def main() -> int:
     diag = pipeline.diagnose(config, requested_sources)
 
     if args.diagnose:
-        print(json.dumps(diag, indent=2, sort_keys=True))
+        print(dumps_pretty_json(diag))
         return 0
 
     if not topic:
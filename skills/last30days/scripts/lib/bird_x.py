@@ -5,6 +5,7 @@ via Twitter's GraphQL API. No external `bird` CLI binary needed - just Node.js.
 See scripts/lib/vendor/bird-search/package.json for authoritative version.
 """
 
+import functools
 import json
 import os
 import signal
@@ -14,9 +15,11 @@ import sys
 from pathlib import Path
 
 from . import http, log
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from .query import extract_compound_terms, extract_core_subject
 from .relevance import token_overlap_relevance as _compute_relevance
 
 
@@ -80,15 +83,16 @@ def _extract_core_subject(topic: str) -> str:
     Aggressively strip question/meta/research words to keep only the
     core product/concept name (max 5 words).
     """
-    from .query import extract_core_subject
     return extract_core_subject(topic, max_words=5, strip_suffixes=True)
 
 
+@functools.lru_cache(maxsize=1)
 def is_bird_installed() -> bool:
     """Check if vendored Bird search module is available.
 
     Returns:
-        True if bird-search.mjs exists and Node.js is in PATH.
+        True if bird-search.mjs exists and Node.js is in PATH. Cached for the
+        life of the process; neither changes mid-run.
     """
     if not _BIRD_SEARCH_MJS.exists():
         return False
@@ -111,6 +115,7 @@ def is_bird_authenticated() -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def check_npm_available() -> bool:
     """Check if npm is available (kept for API compatibility).
 
@@ -259,7 +264,6 @@ def search_x(
     # Retry with OR groups for multi-word queries (X supports OR operator)
     core_words = core_topic.split()
     if not items and len(core_words) >= 2:
-        from .query import extract_compound_terms
         compounds = extract_compound_terms(topic)
         if compounds:
             # Build OR-group query: ("multi-agent" OR "agent simulation") since:DATE
@@ -372,8 +376,6 @@ def search_handles(
             _log(f"Handle search error for @{handle}: {e}")
         return []
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     all_items: List[Dict[str, Any]] = []
     with ThreadPoolExecutor(max_workers=min(5, len(handles))) as executor:
         futures = {executor.submit(_search_one_handle, h): h for h in handles}
@@ -383,17 +385,19 @@ def search_handles(
     return all_items
 
 
-def parse_bird_response(response: Dict[str, Any], query: str = "") -> List[Dict[str, Any]]:
+def parse_bird_response(response: Optional[Dict[str, Any]], query: str = "") -> List[Dict[str, Any]]:
     """Parse Bird response to match xai_x output format.
 
     Args:
-        response: Raw Bird JSON response
+        response: Raw Bird JSON response (None when the search produced nothing)
         query: Original search query for relevance scoring
 
     Returns:
         List of normalized item dicts matching xai_x.parse_x_response() format.
     """
     items = []
+    if not response:
+        return items
 
     # Check for errors
     if "error" in response and response["error"]:
@@ -410,11 +414,13 @@ def parse_bird_response(response: Dict[str, Any], query: str = "") -> List[Dict[
         if not isinstance(tweet, dict):
             continue
 
+        # Bird uses author.username, older format uses user.screen_name
+        author = tweet.get("author", {}) or tweet.get("user", {})
+
         # Extract URL - Bird uses permanent_url or we construct from id
         url = tweet.get("permanent_url") or tweet.get("url", "")
         if not url and tweet.get("id"):
             # Try different field structures Bird might use
-            author = tweet.get("author", {}) or tweet.get("user", {})
             screen_name = author.get("username") or author.get("screen_name", "")
             if screen_name:
                 url = f"https://x.com/{screen_name}/status/{tweet['id']}"
@@ -438,8 +444,7 @@ def parse_bird_response(response: Dict[str, Any], query: str = "") -> List[Dict[
             except (ValueError, TypeError):
                 pass
 
-        # Extract user info (Bird uses author.username, older format uses user.screen_name)
-        author = tweet.get("author", {}) or tweet.get("user", {})
+        # Extract user info
         author_handle = author.get("username") or author.get("screen_name", "") or tweet.get("author_handle", "")
 
         # Build engagement dict (Bird uses camelCase: likeCount, retweetCount, etc.)
@@ -457,16 +462,22 @@ def parse_bird_response(response: Dict[str, Any], query: str = "") -> List[Dict[
                 except (ValueError, TypeError):
                     engagement[key] = None
 
+        # Tweet text, stringified once; relevance only scores the "text" field
+        has_text = "text" in tweet
+        text = tweet["text"] if has_text else tweet.get("full_text", "")
+        if not isinstance(text, str):
+            text = str(text)
+
         # Build normalized item
         item = {
             "id": f"X{i+1}",
-            "text": str(tweet.get("text", tweet.get("full_text", ""))).strip()[:500],
+            "text": text.strip()[:500],
             "url": url,
             "author_handle": author_handle.lstrip("@"),
             "date": date,
             "engagement": engagement if any(v is not None for v in engagement.values()) else None,
             "why_relevant": "",  # Bird doesn't provide relevance explanations
-            "relevance": _compute_relevance(query, str(tweet.get("text", ""))) if query else 0.7,
+            "relevance": _compute_relevance(query, text if has_text else "") if query else 0.7,
         }
 
         items.append(item)
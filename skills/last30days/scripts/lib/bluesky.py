@@ -10,8 +10,10 @@ import sys
 import time
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 from . import http, log
+from .query import extract_core_subject
 
 BSKY_SESSION_URL = "https://bsky.social/xrpc/com.atproto.server.createSession"
 BSKY_SEARCH_URL = "https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts"
@@ -90,15 +92,16 @@ def _reset_session_cache() -> None:
     _session_error = None
 
 
+_BSKY_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features', 'recommendations', 'advice',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Bluesky search."""
-    from .query import extract_core_subject
-    _BSKY_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features', 'recommendations', 'advice',
-    })
     return extract_core_subject(topic, noise=_BSKY_NOISE)
 
 
@@ -149,7 +152,6 @@ def search_bluesky(
 
     _log(f"Searching for '{core_topic}' (depth={depth}, limit={count})")
 
-    from urllib.parse import urlencode
     params = {
         "q": core_topic,
         "limit": str(min(count, 100)),
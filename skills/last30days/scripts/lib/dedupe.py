@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from typing import Callable
 
 from . import schema
 
@@ -34,9 +35,13 @@ STOPWORDS = frozenset(
 )
 
 
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def normalize_text(text: str) -> str:
-    text = re.sub(r"[^\w\s]", " ", text.lower())
-    return re.sub(r"\s+", " ", text).strip()
+    text = _PUNCT_RE.sub(" ", text.lower())
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 def get_ngrams(text: str, n: int = 3) -> set[str]:
@@ -125,3 +130,24 @@ def dedupe_items(items: list[schema.SourceItem], threshold: float = 0.7) -> list
             kept.append(item)
             kept_prepared.append(prep)
     return kept
+
+
+def sort_and_dedupe(
+    items: list[schema.SourceItem],
+    key: Callable[[schema.SourceItem], float],
+    threshold: float = 0.7,
+) -> list[schema.SourceItem]:
+    """Sort best-first, drop exact URL repeats, then remove near-duplicates.
+
+    The URL pass is linear, so the same post merged in from several
+    subqueries never reaches the pairwise similarity check.
+    """
+    seen_urls: set[str] = set()
+    unique: list[schema.SourceItem] = []
+    for item in sorted(items, key=key, reverse=True):
+        if item.url:
+            if item.url in seen_urls:
+                continue
+            seen_urls.add(item.url)
+        unique.append(item)
+    return dedupe_items(unique, threshold)
@@ -13,6 +13,10 @@ GENERIC_HANDLES = {
     "verified", "jack", "sundarpichai",
 }
 
+_MENTION_RE = re.compile(r'@(\w{1,15})')
+_HASHTAG_RE = re.compile(r'#(\w{2,30})')
+_SUBREDDIT_REF_RE = re.compile(r'r/(\w{2,30})')
+
 
 def extract_entities(
     reddit_items: List[Dict[str, Any]],
@@ -47,6 +51,15 @@ def extract_entities(
     }
 
 
+def extract_x_handles(x_items: List[Dict[str, Any]], max_handles: int = 5) -> List[str]:
+    """Extract only the top @handles from X results.
+
+    For callers that use handles alone (Phase 2 handle search), so they skip
+    the hashtag and subreddit passes of extract_entities().
+    """
+    return _extract_x_handles(x_items)[:max_handles]
+
+
 def _extract_x_handles(x_items: List[Dict[str, Any]]) -> List[str]:
     """Extract and rank @handles from X results.
 
@@ -66,7 +79,7 @@ def _extract_x_handles(x_items: List[Dict[str, Any]]) -> List[str]:
 
         # @mentions in text
         text = item.get("text", "")
-        mentions = re.findall(r'@(\w{1,15})', text)
+        mentions = _MENTION_RE.findall(text)
         for mention in mentions:
             mention_lower = mention.lower()
             if mention_lower not in GENERIC_HANDLES:
@@ -85,7 +98,7 @@ def _extract_x_hashtags(x_items: List[Dict[str, Any]]) -> List[str]:
 
     for item in x_items:
         text = item.get("text", "")
-        tags = re.findall(r'#(\w{2,30})', text)
+        tags = _HASHTAG_RE.findall(text)
         for tag in tags:
             hashtag_counts[tag.lower()] += 1
 
@@ -112,14 +125,14 @@ def _extract_subreddits(reddit_items: List[Dict[str, Any]]) -> List[str]:
 
         # Cross-references in comment insights
         for insight in item.get("comment_insights", []):
-            cross_refs = re.findall(r'r/(\w{2,30})', insight)
+            cross_refs = _SUBREDDIT_REF_RE.findall(insight)
             for ref in cross_refs:
                 sub_counts[ref] += 1
 
         # Cross-references in top comments
         for comment in item.get("top_comments", []):
             excerpt = comment.get("excerpt", "")
-            cross_refs = re.findall(r'r/(\w{2,30})', excerpt)
+            cross_refs = _SUBREDDIT_REF_RE.findall(excerpt)
             for ref in cross_refs:
                 sub_counts[ref] += 1
 
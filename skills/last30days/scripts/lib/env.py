@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import binascii
+import functools
 import json
 import os
 import sys
@@ -68,26 +69,39 @@ def _check_file_permissions(path: Path) -> None:
 
 
 def load_env_file(path: Path) -> dict[str, str]:
-    """Load environment variables from a file."""
+    """Load environment variables from a file.
+
+    Parsed results are cached per (path, mtime), so repeated loads of an
+    unchanged file skip the read while a rewritten file is picked up.
+    """
+    if not path:
+        return {}
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    return dict(_parse_env_file(path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_file(path: Path, mtime_ns: int) -> dict[str, str]:
     env = {}
-    if not path or not path.exists():
-        return env
     _check_file_permissions(path)
 
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key = key.strip()
-                value = value.strip()
-                # Remove quotes if present
-                if value and value[0] in ('"', "'") and value[-1] == value[0]:
-                    value = value[1:-1]
-                if key and value:
-                    env[key] = value
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        if not sep:
+            continue
+        key = key.strip()
+        value = value.strip()
+        # Remove quotes if present
+        if value and value[0] in ('"', "'") and value[-1] == value[0]:
+            value = value[1:-1]
+        if key and value:
+            env[key] = value
     return env
 
 
@@ -214,7 +228,15 @@ def get_config() -> dict[str, Any]:
       1. Environment variables (os.environ)
       2. .claude/last30days.env (per-project config)
       3. ~/.config/last30days/.env (global config)
+
+    Resolved once per process (including browser cookie extraction);
+    each call returns a fresh copy that callers may mutate.
     """
+    return dict(_load_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> dict[str, Any]:
     # Load from global config file
     file_env = load_env_file(CONFIG_FILE) if CONFIG_FILE else {}
 
@@ -273,7 +273,7 @@ def _enrich_top_items(
         for future in as_completed(futures):
             idx = futures[future]
             try:
-                comments = future.result(timeout=15)
+                comments = future.result()
                 items[idx]["metadata"]["top_comments"] = comments
             except (KeyError, TypeError, OSError) as exc:
                 _log(f"Comment enrichment failed for {items[idx].get('url', '?')}: {type(exc).__name__}: {exc}")
@@ -581,7 +581,7 @@ def search_github_person(
         for future in as_completed(ext_futures):
             repo, pr_count = ext_futures[future]
             try:
-                enrichment = future.result(timeout=20)
+                enrichment = future.result()
             except Exception as exc:
                 _log(f"External repo enrichment failed for {repo}: {exc}")
                 enrichment = {}
@@ -628,7 +628,7 @@ def search_github_person(
         for future in as_completed(own_futures):
             own_repo = own_futures[future]
             try:
-                enrichment = future.result(timeout=25)
+                enrichment = future.result()
             except Exception as exc:
                 _log(f"Own repo enrichment failed for {own_repo['full_name']}: {exc}")
                 enrichment = {}
@@ -744,7 +744,7 @@ def search_github_project(
         for idx, future in enumerate(as_completed(futures)):
             repo = futures[future]
             try:
-                enrichment = future.result(timeout=25)
+                enrichment = future.result()
             except Exception as exc:
                 _log(f"Project enrichment failed for {repo}: {exc}")
                 continue
@@ -883,7 +883,7 @@ def enrich_candidates_with_stars(
         for future in as_completed(futures):
             repo = futures[future]
             try:
-                info = future.result(timeout=10)
+                info = future.result()
                 if info:
                     star_map[repo.lower()] = info["stars"]
             except Exception:
@@ -187,6 +187,29 @@ def _parse_serper_date(raw: str) -> str | None:
 # Dispatcher
 # ---------------------------------------------------------------------------
 
+# Backend name -> (config key, search function), in auto-detection priority order
+_BACKENDS = {
+    "brave": ("BRAVE_API_KEY", brave_search),
+    "exa": ("EXA_API_KEY", exa_search),
+    "serper": ("SERPER_API_KEY", serper_search),
+    "parallel": ("PARALLEL_API_KEY", parallel_search),
+}
+
+
+def resolve_backend(config: dict, backend: str = "auto") -> str:
+    """Resolve ``"auto"`` to the first configured web backend, or ``"none"``.
+
+    Explicit backends pass through unchanged. Callers that search many
+    subqueries resolve once up front instead of on every ``web_search`` call.
+    """
+    if backend != "auto":
+        return backend
+    for name, (key_name, _search) in _BACKENDS.items():
+        if config.get(key_name):
+            return name
+    return "none"
+
+
 def web_search(
     query: str,
     date_range: tuple[str, str],
@@ -194,40 +217,17 @@ def web_search(
     backend: str = "auto",
 ) -> tuple[list[dict], dict]:
     """Run web search with the specified or auto-detected backend."""
-    if backend == "auto":
-        if config.get("BRAVE_API_KEY"):
-            backend = "brave"
-        elif config.get("EXA_API_KEY"):
-            backend = "exa"
-        elif config.get("SERPER_API_KEY"):
-            backend = "serper"
-        elif config.get("PARALLEL_API_KEY"):
-            backend = "parallel"
-        else:
-            return [], {}
-    if backend == "brave":
-        key = config.get("BRAVE_API_KEY")
-        if not key:
-            raise RuntimeError("BRAVE_API_KEY is required when web_backend='brave'")
-        return brave_search(query, date_range, key)
-    if backend == "exa":
-        key = config.get("EXA_API_KEY")
-        if not key:
-            raise RuntimeError("EXA_API_KEY is required when web_backend='exa'")
-        return exa_search(query, date_range, key)
-    if backend == "serper":
-        key = config.get("SERPER_API_KEY")
-        if not key:
-            raise RuntimeError("SERPER_API_KEY is required when web_backend='serper'")
-        return serper_search(query, date_range, key)
-    if backend == "parallel":
-        key = config.get("PARALLEL_API_KEY")
-        if not key:
-            raise RuntimeError("PARALLEL_API_KEY is required when web_backend='parallel'")
-        return parallel_search(query, date_range, key)
-    if backend != "none":
-        raise ValueError(f"Unsupported web backend: {backend!r}")
-    return [], {}
+    backend = resolve_backend(config, backend)
+    if backend == "none":
+        return [], {}
+    try:
+        key_name, search = _BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unsupported web backend: {backend!r}") from None
+    key = config.get(key_name)
+    if not key:
+        raise RuntimeError(f"{key_name} is required when web_backend={backend!r}")
+    return search(query, date_range, key)
 
 
 # ---------------------------------------------------------------------------
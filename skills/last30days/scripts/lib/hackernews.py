@@ -11,6 +11,7 @@ import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 import re
 
@@ -58,7 +59,6 @@ def _unix_to_date(ts: int) -> str:
 
 def _strip_html(text: str) -> str:
     """Strip HTML tags and decode entities from HN comment text."""
-    import re
     text = html.unescape(text)
     text = re.sub(r'<p>', '\n', text)
     text = re.sub(r'<[^>]+>', '', text)
@@ -100,7 +100,6 @@ def search_hackernews(
         "hitsPerPage": str(count),
     }
 
-    from urllib.parse import urlencode
     url = f"{ALGOLIA_SEARCH_URL}?{urlencode(params)}"
 
     try:
@@ -290,7 +289,7 @@ def enrich_top_stories(
         for future in as_completed(futures):
             idx = futures[future]
             try:
-                result = future.result(timeout=15)
+                result = future.result()
                 items[idx]["top_comments"] = result["comments"]
                 items[idx]["comment_insights"] = result["comment_insights"]
             except (KeyError, TypeError, OSError) as exc:
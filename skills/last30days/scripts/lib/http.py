@@ -1,14 +1,26 @@
-"""HTTP utilities for last30days skill (stdlib only)."""
+"""HTTP utilities for last30days skill.
 
+Uses a shared keep-alive ``requests.Session`` when requests is installed and
+falls back to stdlib urllib otherwise. JSON bodies are decoded with orjson
+when it is installed.
+"""
+
+import io
 import json
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
 from typing import Any, Dict, Optional, Union
 from urllib.parse import urlencode
 
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 from . import log as _log
 
 DEFAULT_TIMEOUT = 30
@@ -24,6 +36,14 @@ MAX_429_RETRIES = 2
 RETRY_DELAY = 2.0
 USER_AGENT = "last30days-skill/3.0 (Assistant Skill)"
 
+# Sized to the pipeline's widest fan-out (16 streams) so concurrent calls to
+# the same host reuse pooled connections instead of re-handshaking TLS.
+POOL_MAXSIZE = 16
+
+_session = None
+_session_unavailable = False
+_session_lock = threading.Lock()
+
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
@@ -33,6 +53,71 @@ class HTTPError(Exception):
         self.body = body
 
 
+def get_session():
+    """Return the process-wide keep-alive session, or None without requests.
+
+    requests is imported on first use rather than at module load: it is the
+    single largest import on the CLI startup path, and mock, --diagnose and
+    setup runs never need it.
+    """
+    global _session, _session_unavailable
+    if _session is None and not _session_unavailable:
+        with _session_lock:
+            if _session is None and not _session_unavailable:
+                try:
+                    import http.cookiejar
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except ImportError:
+                    _session_unavailable = True
+                    return None
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                # Match urllib: never carry cookies between unrelated calls.
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                _session = session
+    return _session
+
+
+def _loads(content: bytes) -> Any:
+    """Decode a JSON response body straight from bytes (orjson when available).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+    need to handle the stdlib exception.
+    """
+    if _orjson is not None:
+        return _orjson.loads(content)
+    return json.loads(content)
+
+
+def _open(
+    method: str,
+    url: str,
+    data: Optional[bytes],
+    headers: Dict[str, str],
+    timeout: int,
+) -> tuple:
+    """Send one request and return ``(status, body_bytes)``.
+
+    Error statuses raise ``urllib.error.HTTPError`` on both transports so the
+    retry logic in ``request`` handles them identically.
+    """
+    session = get_session()
+    if session is None:
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, response.read()
+    response = session.request(method, url, data=data, headers=headers, timeout=timeout)
+    if response.status_code >= 400:
+        raise urllib.error.HTTPError(
+            url, response.status_code, response.reason, response.headers,
+            io.BytesIO(response.content),
+        )
+    return response.status_code, response.content
+
+
 def request(
     method: str,
     url: str,
@@ -78,8 +163,6 @@ def request(
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
     safe_url = re.sub(r'([?&])(key|api_key|token|secret)=[^&]*', r'\1\2=***', url)
     log(f"{method} {safe_url}")
 
@@ -87,12 +170,11 @@ def request(
     rate_limit_count = 0
     for attempt in range(retries):
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                if raw:
-                    return body
-                return json.loads(body) if body else {}
+            status, content = _open(method, url, data, headers, timeout)
+            log(f"Response: {status} ({len(content)} bytes)")
+            if raw:
+                return content.decode('utf-8')
+            return _loads(content) if content else {}
         except urllib.error.HTTPError as e:
             body = None
             try:
@@ -140,7 +222,8 @@ def request(
             last_error = HTTPError(f"Invalid JSON response: {e}")
             raise last_error
         except (OSError, TimeoutError, ConnectionResetError) as e:
-            # Handle socket-level errors (connection reset, timeout, etc.)
+            # Handle socket-level errors (connection reset, timeout, etc.).
+            # requests' exceptions subclass OSError and land here too.
             log(f"Connection error: {type(e).__name__}: {e}")
             last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
             if attempt < retries - 1:
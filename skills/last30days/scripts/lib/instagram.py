@@ -11,13 +11,11 @@ import re
 import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
-
-try:
-    import requests as _requests
-except ImportError:
-    _requests = None
+from urllib.parse import urlencode
 
 from . import dates, http, log
+from .query import extract_core_subject
+from .snippet import truncate_words
 
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com"
 
@@ -34,18 +32,19 @@ CAPTION_MAX_WORDS = 500
 from .relevance import token_overlap_relevance as _compute_relevance
 
 
+_INSTAGRAM_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome', 'killer',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features',
+    'recommendations', 'advice',
+    'prompt', 'prompts', 'prompting',
+    'methods', 'strategies', 'approaches',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Instagram search."""
-    from .query import extract_core_subject
-    _INSTAGRAM_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome', 'killer',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features',
-        'recommendations', 'advice',
-        'prompt', 'prompts', 'prompting',
-        'methods', 'strategies', 'approaches',
-    })
     return extract_core_subject(topic, noise=_INSTAGRAM_NOISE)
 
 
@@ -236,9 +235,9 @@ def _user_reels(
     """
     _log(f"User reels: @{handle}")
     reels_url = f"{SCRAPECREATORS_BASE}/v1/instagram/user/reels"
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"handle": handle})
             url = f"{reels_url}?{params}"
             headers = http.scrapecreators_headers(token)
@@ -249,7 +248,7 @@ def _user_reels(
             return []
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 reels_url,
                 params={"handle": handle},
                 headers=http.scrapecreators_headers(token),
@@ -293,10 +292,10 @@ def search_instagram(
 
     _log(f"Searching Instagram for '{core_topic}' (depth={depth}, count={config['results_per_page']})")
 
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         _log("requests library not installed, falling back to urllib")
         try:
-            from urllib.parse import urlencode
             params = urlencode({"query": core_topic})
             url = f"{SCRAPECREATORS_BASE}/v2/instagram/reels/search?{params}"
             headers = http.scrapecreators_headers(token)
@@ -307,7 +306,7 @@ def search_instagram(
             return {"items": [], "error": f"{type(e).__name__}: {e}"}
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/v2/instagram/reels/search",
                 params={"query": core_topic},
                 headers=http.scrapecreators_headers(token),
@@ -367,7 +366,8 @@ def fetch_captions(
     config = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     max_captions = config["max_captions"]
 
-    if not video_items or not token or not _requests:
+    session = http.get_session()
+    if not video_items or not token or session is None:
         return {}
 
     top_items = video_items[:max_captions]
@@ -380,9 +380,7 @@ def fetch_captions(
         vid = item["video_id"]
         text = item.get("text", "")
         if text:
-            words = text.split()
-            if len(words) > CAPTION_MAX_WORDS:
-                text = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
+            text = truncate_words(text, CAPTION_MAX_WORDS)
             captions[vid] = text
 
     # Second pass: try to get spoken-word transcripts (1 credit each)
@@ -392,7 +390,7 @@ def fetch_captions(
         if not url:
             continue
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/v2/instagram/media/transcript",
                 params={"url": url},
                 headers=http.scrapecreators_headers(token),
@@ -408,9 +406,7 @@ def fetch_captions(
                         if isinstance(t, dict) and t.get("text")
                     )
                     if transcript_text:
-                        words = transcript_text.split()
-                        if len(words) > CAPTION_MAX_WORDS:
-                            transcript_text = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
+                        transcript_text = truncate_words(transcript_text, CAPTION_MAX_WORDS)
                         captions[vid] = transcript_text
         except Exception as e:
             _log(f"Transcript fetch failed for {vid}: {e}")
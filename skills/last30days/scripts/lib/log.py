@@ -1,5 +1,11 @@
-"""Shared logging utilities for last30days skill."""
+"""Shared logging utilities for last30days skill.
 
+Each message is a single newline-terminated write. sys.stderr is
+line-buffered on Python 3.9+, so that write is one syscall and needs no
+explicit flush.
+"""
+
+import functools
 import os
 import sys
 
@@ -10,7 +16,12 @@ def debug(msg: str) -> None:
     """Log debug message to stderr (only when LAST30DAYS_DEBUG is set)."""
     if DEBUG:
         sys.stderr.write(f"[DEBUG] {msg}\n")
-        sys.stderr.flush()
+
+
+@functools.lru_cache(maxsize=4)
+def _is_tty(stream) -> bool:
+    """Cached isatty() per stream object; it is an ioctl on every call."""
+    return stream.isatty()
 
 
 def source_log(prefix: str, msg: str, *, tty_only: bool = True) -> None:
@@ -22,7 +33,7 @@ def source_log(prefix: str, msg: str, *, tty_only: bool = True) -> None:
         tty_only: If True, only log when stderr is a TTY (avoids cluttering
                   non-interactive output like Claude Code).
     """
-    if tty_only and not sys.stderr.isatty():
+    stream = sys.stderr
+    if tty_only and not _is_tty(stream):
         return
-    sys.stderr.write(f"[{prefix}] {msg}\n")
-    sys.stderr.flush()
+    stream.write(f"[{prefix}] {msg}\n")
@@ -36,25 +36,7 @@ def normalize_source_items(
 ) -> list[schema.SourceItem]:
     """Normalize raw source items, filter by date range, with evergreen fallback for how_to queries."""
     source = source.lower()
-    normalizers = {
-        "reddit": _normalize_reddit,
-        "x": _normalize_x,
-        "youtube": _normalize_youtube,
-        "tiktok": lambda s, i, idx, fd, td: _normalize_shortform_video(s, i, idx, fd, td, "TK", "TikTok post"),
-        "instagram": lambda s, i, idx, fd, td: _normalize_shortform_video(s, i, idx, fd, td, "IG", "Instagram reel"),
-        "hackernews": _normalize_hackernews,
-        "bluesky": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "BS", "Bluesky post"),
-        "truthsocial": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "TS", "Truth Social post"),
-        "threads": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "TH", "Threads post"),
-        "xquik": _normalize_x,
-        "pinterest": _normalize_pinterest,
-        "polymarket": _normalize_polymarket,
-        "grounding": _normalize_grounding,
-        "xiaohongshu": _normalize_grounding,
-        "github": _normalize_github,
-        "perplexity": _normalize_grounding,
-    }
-    normalizer = normalizers.get(source)
+    normalizer = _NORMALIZERS.get(source)
     if normalizer is None:
         raise ValueError(f"Unsupported source: {source}")
     normalized = [normalizer(source, item, index, from_date, to_date) for index, item in enumerate(items)]
@@ -480,14 +462,17 @@ def _normalize_grounding(
     title = str(item.get("title") or "").strip()
     snippet = str(item.get("snippet") or "").strip()
     url = str(item.get("url") or "").strip()
+    source_domain = item.get("source_domain")
+    # Parse the URL at most once; it backs both the title and container fallbacks.
+    url_domain = _domain_from_url(url) if not (title and source_domain) else None
     return _source_item(
         item_id=str(item.get("id") or f"W{index + 1}"),
         source=source,
-        title=title or _domain_from_url(url) or f"Web result {index + 1}",
+        title=title or url_domain or f"Web result {index + 1}",
         body="\n".join(part for part in [title, snippet] if part),
         url=url,
         author=None,
-        container=str(item.get("source_domain") or _domain_from_url(url) or ""),
+        container=str(source_domain or url_domain or ""),
         published_at=item.get("date"),
         date_confidence=_date_confidence(item, from_date, to_date),
         engagement=item.get("engagement") or {},
@@ -496,3 +481,24 @@ def _normalize_grounding(
         snippet=snippet,
         metadata=item.get("metadata") or {},
     )
+
+
+# Built once at import rather than on every normalize_source_items() call.
+_NORMALIZERS = {
+    "reddit": _normalize_reddit,
+    "x": _normalize_x,
+    "youtube": _normalize_youtube,
+    "tiktok": lambda s, i, idx, fd, td: _normalize_shortform_video(s, i, idx, fd, td, "TK", "TikTok post"),
+    "instagram": lambda s, i, idx, fd, td: _normalize_shortform_video(s, i, idx, fd, td, "IG", "Instagram reel"),
+    "hackernews": _normalize_hackernews,
+    "bluesky": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "BS", "Bluesky post"),
+    "truthsocial": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "TS", "Truth Social post"),
+    "threads": lambda s, i, idx, fd, td: _normalize_microblog(s, i, idx, fd, td, "TH", "Threads post"),
+    "xquik": _normalize_x,
+    "pinterest": _normalize_pinterest,
+    "polymarket": _normalize_polymarket,
+    "grounding": _normalize_grounding,
+    "xiaohongshu": _normalize_grounding,
+    "github": _normalize_github,
+    "perplexity": _normalize_grounding,
+}
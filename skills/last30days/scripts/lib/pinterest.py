@@ -10,13 +10,10 @@ API docs: https://scrapecreators.com/docs
 import re
 import sys
 from typing import Any, Dict, List, Optional, Set
-
-try:
-    import requests as _requests
-except ImportError:
-    _requests = None
+from urllib.parse import urlencode
 
 from . import dates, http, log
+from .query import extract_core_subject
 
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com/v1/pinterest"
 
@@ -30,18 +27,19 @@ DEPTH_CONFIG = {
 from .relevance import token_overlap_relevance as _compute_relevance
 
 
+_PINTEREST_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome', 'killer',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features',
+    'recommendations', 'advice',
+    'prompt', 'prompts', 'prompting',
+    'methods', 'strategies', 'approaches',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Pinterest search."""
-    from .query import extract_core_subject
-    _PINTEREST_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome', 'killer',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features',
-        'recommendations', 'advice',
-        'prompt', 'prompts', 'prompting',
-        'methods', 'strategies', 'approaches',
-    })
     return extract_core_subject(topic, noise=_PINTEREST_NOISE)
 
 
@@ -140,10 +138,10 @@ def search_pinterest(
 
     _log(f"Searching Pinterest for '{core_topic}' (depth={depth}, count={config['results_per_page']})")
 
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         _log("requests library not installed, falling back to urllib")
         try:
-            from urllib.parse import urlencode
             params = urlencode({"keyword": core_topic})
             url = f"{SCRAPECREATORS_BASE}/search?{params}"
             headers = http.scrapecreators_headers(token)
@@ -154,7 +152,7 @@ def search_pinterest(
             return {"items": [], "error": f"{type(e).__name__}: {e}"}
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/search",
                 params={"keyword": core_topic},
                 headers=http.scrapecreators_headers(token),
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from shutil import which
 from typing import Any
@@ -100,7 +101,7 @@ def available_sources(config: dict[str, Any], requested_sources: list[str] | Non
         available.extend(["tiktok", "instagram"])
     if env.get_x_source(config):
         available.append("x")
-    if which("yt-dlp") or env.is_youtube_sc_available(config):
+    if youtube_yt.is_ytdlp_installed() or env.is_youtube_sc_available(config):
         available.append("youtube")
     available.extend(["hackernews", "polymarket"])
     if config.get("GITHUB_TOKEN") or which("gh"):
@@ -109,7 +110,7 @@ def available_sources(config: dict[str, Any], requested_sources: list[str] | Non
         available.append("bluesky")
     if env.is_truthsocial_available(config):
         available.append("truthsocial")
-    if config.get("BRAVE_API_KEY") or config.get("EXA_API_KEY") or config.get("SERPER_API_KEY") or config.get("PARALLEL_API_KEY"):
+    if grounding.resolve_backend(config) != "none":
         available.append("grounding")
     # Perplexity Sonar: opt-in additive source via INCLUDE_SOURCES=perplexity
     include_sources = (config.get("INCLUDE_SOURCES") or "").lower().split(",")
@@ -128,17 +129,12 @@ def available_sources(config: dict[str, Any], requested_sources: list[str] | Non
 
 def diagnose(config: dict[str, Any], requested_sources: list[str] | None = None) -> dict[str, Any]:
     requested_sources = normalize_requested_sources(requested_sources)
+    available = available_sources(config, requested_sources)
     google_key = _google_key(config)
     x_status = env.get_x_source_status(config)
-    native_web_backend = None
-    if config.get("BRAVE_API_KEY"):
-        native_web_backend = "brave"
-    elif config.get("EXA_API_KEY"):
-        native_web_backend = "exa"
-    elif config.get("SERPER_API_KEY"):
-        native_web_backend = "serper"
-    elif config.get("PARALLEL_API_KEY"):
-        native_web_backend = "parallel"
+    native_web_backend = grounding.resolve_backend(config)
+    if native_web_backend == "none":
+        native_web_backend = None
     providers_status = {
         "google": bool(google_key),
         "openai": bool(config.get("OPENAI_API_KEY")) and config.get("OPENAI_AUTH_STATUS") == env.AUTH_STATUS_OK,
@@ -155,8 +151,9 @@ def diagnose(config: dict[str, Any], requested_sources: list[str] | None = None)
         "bird_username": x_status["bird_username"],
         "native_web_backend": native_web_backend,
         "has_scrapecreators": bool(config.get("SCRAPECREATORS_API_KEY")),
-        "has_github": bool(config.get("GITHUB_TOKEN") or which("gh")),
-        "available_sources": available_sources(config, requested_sources),
+        # Same GITHUB_TOKEN-or-gh probe available_sources just ran
+        "has_github": "github" in available,
+        "available_sources": available,
     }
 
 
@@ -262,55 +259,21 @@ def run(
     # (source=deterministic AND no pre-research flags). LAW 7 backstop.
     bundle.artifacts["plan_source"] = plan_source
 
-    # Project-mode or person-mode GitHub: run once before the main subquery loop
+    # Project-mode or person-mode GitHub runs alongside the Phase 1 streams;
+    # GitHub keyword streams wait for it and only run if it comes back empty.
     _github_custom_done = False
+    _github_person_done = False
     _github_enriched_repos: set[str] = set()
+    primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
 
-    # Project mode takes priority over person mode
-    if github_repos and "github" in available:
-        try:
-            project_items = github.search_github_project(
-                github_repos, from_date, to_date,
-                depth=depth, token=config.get("GITHUB_TOKEN"),
-            )
-            if project_items:
-                normalized = _normalize_score_dedupe(
-                    "github", project_items, from_date, to_date,
-                    freshness_mode=plan.freshness_mode,
-                    ranking_query=f"What are {', '.join(github_repos)} doing on GitHub?",
-                )
-                primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
-                bundle.add_items(primary_label, "github", normalized)
-                _github_custom_done = True
-                _github_enriched_repos = {r.lower() for r in github_repos}
-        except Exception as exc:
-            bundle.errors_by_source["github"] = f"Project-mode failed: {exc}"
-
-    _github_person_done = False
-    if github_user and "github" in available and not _github_custom_done:
-        try:
-            person_items = github.search_github_person(
-                github_user, from_date, to_date,
-                depth=depth, token=config.get("GITHUB_TOKEN"),
-            )
-            if person_items:
-                normalized = _normalize_score_dedupe(
-                    "github", person_items, from_date, to_date,
-                    freshness_mode=plan.freshness_mode,
-                    ranking_query=f"What is @{github_user} doing on GitHub?",
-                )
-                # Use the first subquery's label so RRF can look up the weight
-                primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
-                bundle.add_items(primary_label, "github", normalized)
-                _github_person_done = True
-        except Exception as exc:
-            bundle.errors_by_source["github"] = f"Person-mode failed: {exc}"
+    # Resolve "auto" once so grounding streams skip per-call key detection
+    web_backend = grounding.resolve_backend(config, web_backend)
 
     # Thread-safe set prevents redundant fetches after a source returns 429
     rate_limited_sources: set[str] = set()
     rate_limit_lock = threading.Lock()
 
-    futures = {}
+    futures: dict = {}
     # Per-source fetch budget prevents redundant API calls
     source_fetch_count: dict[str, int] = {}
     stream_count = sum(
@@ -321,13 +284,48 @@ def run(
     )
     max_workers = max(4, min(16, stream_count or 1))
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit_stream(subquery: schema.SubQuery, source: str, delay: float = 0.0):
+            return executor.submit(
+                _retrieve_stream_after,
+                delay,
+                freshness_mode=plan.freshness_mode,
+                per_stream_limit=settings["per_stream_limit"],
+                topic=topic,
+                subquery=subquery,
+                source=source,
+                config=config,
+                depth=depth,
+                date_range=(from_date, to_date),
+                runtime=runtime,
+                mock=mock,
+                rate_limited_sources=rate_limited_sources,
+                rate_limit_lock=rate_limit_lock,
+                web_backend=web_backend,
+                raw_topic=topic,
+                subreddits=subreddits,
+                tiktok_hashtags=tiktok_hashtags,
+                tiktok_creators=tiktok_creators,
+                ig_creators=ig_creators,
+            )
+
+        github_future = None
+        deferred_github: list[schema.SubQuery] = []
+        if (github_repos or github_user) and "github" in available:
+            github_future = executor.submit(
+                _search_github_custom,
+                github_repos=github_repos,
+                github_user=github_user,
+                date_range=(from_date, to_date),
+                depth=depth,
+                token=config.get("GITHUB_TOKEN"),
+                freshness_mode=plan.freshness_mode,
+            )
+
         for subquery in plan.subqueries:
             for source in subquery.sources:
                 if source not in available:
                     continue
-                # Skip GitHub keyword search if person-mode already ran
-                if source == "github" and (_github_person_done or _github_custom_done):
-                    continue
                 # Enforce per-source fetch cap
                 cap = MAX_SOURCE_FETCHES.get(source)
                 if cap is not None:
@@ -335,87 +333,106 @@ def run(
                     if current >= cap:
                         continue
                     source_fetch_count[source] = current + 1
-                futures[
-                    executor.submit(
-                        _retrieve_stream,
-                        topic=topic,
-                        subquery=subquery,
-                        source=source,
-                        config=config,
-                        depth=depth,
-                        date_range=(from_date, to_date),
-                        runtime=runtime,
-                        mock=mock,
-                        rate_limited_sources=rate_limited_sources,
-                        rate_limit_lock=rate_limit_lock,
-                        web_backend=web_backend,
-                        raw_topic=topic,
-                        subreddits=subreddits,
-                        tiktok_hashtags=tiktok_hashtags,
-                        tiktok_creators=tiktok_creators,
-                        ig_creators=ig_creators,
-                    )
-                ] = (subquery, source)
-
-        for future in as_completed(futures):
-            subquery, source = futures[future]
-            try:
-                raw_items, artifact = future.result()
-            except Exception as exc:
-                # Share 429 signal so pending futures skip this source
-                if _is_rate_limit_error(exc):
-                    with rate_limit_lock:
-                        rate_limited_sources.add(source)
-                    bundle.errors_by_source[source] = str(exc)
+                if source == "github" and github_future is not None:
+                    deferred_github.append(subquery)
                     continue
-                # Retry once for transient 5xx errors
-                if _is_transient_error(exc):
-                    time.sleep(3)
+                futures[submit_stream(subquery, source)] = (subquery, source, None)
+
+        # Phase 2 only needs the X results, so it starts as soon as the last X
+        # stream (including any retry) resolves instead of after all of Phase 1.
+        supplemental_future = None
+
+        def submit_supplemental():
+            return executor.submit(
+                _fetch_supplemental_searches,
+                topic=topic,
+                bundle=bundle,
+                config=config,
+                depth=depth,
+                date_range=(from_date, to_date),
+                runtime=runtime,
+                mock=mock,
+                rate_limited_sources=rate_limited_sources,
+                x_handle=x_handle,
+                x_related=x_related,
+            )
+
+        x_outstanding = sum(1 for _sq, source, _exc in futures.values() if source == "x")
+        if not x_outstanding:
+            supplemental_future = submit_supplemental()
+
+        # Transient-error retries are resubmitted to the pool (with their
+        # backoff applied inside the worker) so one flaky stream never stalls
+        # collection of the others.
+        pending = set(futures)
+        if github_future is not None:
+            pending.add(github_future)
+        # Loop invariants bound once; this loop runs for every stream.
+        errors_by_source = bundle.errors_by_source
+        add_items = bundle.add_items
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future is github_future:
                     try:
-                        raw_items, artifact = _retrieve_stream(
-                            topic=topic, subquery=subquery, source=source,
-                            config=config, depth=depth, date_range=(from_date, to_date),
-                            runtime=runtime, mock=mock,
-                            rate_limited_sources=rate_limited_sources,
-                            rate_limit_lock=rate_limit_lock,
-                            web_backend=web_backend,
-                            raw_topic=topic,
-                            subreddits=subreddits,
-                            tiktok_hashtags=tiktok_hashtags,
-                            tiktok_creators=tiktok_creators,
-                            ig_creators=ig_creators,
-                        )
-                    except Exception as retry_exc:
-                        bundle.errors_by_source[source] = f"{exc} (retried once, still failed: {retry_exc})"
-                        continue
-                else:
-                    bundle.errors_by_source[source] = str(exc)
+                        mode, github_items, github_error = future.result()
+                    except Exception as exc:
+                        mode, github_items, github_error = None, [], str(exc)
+                    if github_error:
+                        errors_by_source["github"] = github_error
+                    if mode:
+                        add_items(primary_label, "github", github_items)
+                        _github_custom_done = mode == "project"
+                        _github_person_done = mode == "person"
+                        if _github_custom_done:
+                            _github_enriched_repos = {r.lower() for r in github_repos}
+                    else:
+                        # Neither mode found anything: fall back to keyword search
+                        for subquery in deferred_github:
+                            stream = submit_stream(subquery, "github")
+                            futures[stream] = (subquery, "github", None)
+                            pending.add(stream)
                     continue
-            normalized = _normalize_score_dedupe(
-                source, raw_items, from_date, to_date,
-                freshness_mode=plan.freshness_mode,
-                ranking_query=subquery.ranking_query,
+                subquery, source, first_exc = futures.pop(future)
+                if source == "x":
+                    x_outstanding -= 1
+                try:
+                    normalized, artifact = future.result()
+                except Exception as exc:
+                    if first_exc is not None:
+                        errors_by_source[source] = f"{first_exc} (retried once, still failed: {exc})"
+                    # Share 429 signal so pending futures skip this source
+                    elif _is_rate_limit_error(exc):
+                        with rate_limit_lock:
+                            rate_limited_sources.add(source)
+                        errors_by_source[source] = str(exc)
+                    # Retry once for transient 5xx errors
+                    elif _is_transient_error(exc):
+                        retry = submit_stream(subquery, source, delay=3)
+                        futures[retry] = (subquery, source, exc)
+                        pending.add(retry)
+                        if source == "x":
+                            x_outstanding += 1
+                    else:
+                        errors_by_source[source] = str(exc)
+                else:
+                    add_items(subquery.label, source, normalized)
+                    if artifact:
+                        bundle.artifacts.setdefault("grounding", []).append(artifact)
+                if source == "x" and not x_outstanding and supplemental_future is None:
+                    supplemental_future = submit_supplemental()
+
+    # Phase 2: supplemental entity-based searches (fetched during Phase 1)
+    if supplemental_future is not None:
+        supplemental = supplemental_future.result()
+        if supplemental:
+            _merge_supplemental_searches(
+                topic=topic,
+                bundle=bundle,
+                plan=plan,
+                date_range=(from_date, to_date),
+                results=supplemental,
             )
-            normalized = normalized[: settings["per_stream_limit"]]
-            bundle.add_items(subquery.label, source, normalized)
-            if artifact:
-                bundle.artifacts.setdefault("grounding", []).append(artifact)
-
-    # Phase 2: supplemental entity-based searches
-    _run_supplemental_searches(
-        topic=topic,
-        bundle=bundle,
-        plan=plan,
-        config=config,
-        depth=depth,
-        date_range=(from_date, to_date),
-        runtime=runtime,
-        mock=mock,
-        rate_limited_sources=rate_limited_sources,
-        rate_limit_lock=rate_limit_lock,
-        x_handle=x_handle,
-        x_related=x_related,
-    )
 
     # Phase 2b: retry thin sources with simplified query
     # Note: _github_skip_sources tells the retry to not re-run GitHub keyword search
@@ -515,8 +532,7 @@ def _finalize_items_by_source(
 ) -> dict[str, list[schema.SourceItem]]:
     finalized = {}
     for source, items in items_by_source_raw.items():
-        items = sorted(items, key=lambda item: item.local_rank_score or 0.0, reverse=True)
-        items = dedupe.dedupe_items(items)
+        items = dedupe.sort_and_dedupe(items, key=lambda item: item.local_rank_score or 0.0)
         # Post-merge topic-relevance filter for Polymarket: comparison queries
         # fan out into per-entity subqueries ("Hermes", "OpenClaw") whose topic
         # is too narrow for Gamma API to filter meaningfully. Re-validating the
@@ -573,54 +589,50 @@ def _is_transient_error(exc: Exception) -> bool:
     return any(code in msg for code in ("500", "502", "503", "504"))
 
 
-def _run_supplemental_searches(
+def _fetch_supplemental_searches(
     *,
     topic: str,
     bundle: schema.RetrievalBundle,
-    plan: schema.QueryPlan,
     config: dict[str, Any],
     depth: str,
     date_range: tuple[str, str],
     runtime: schema.ProviderRuntime,
     mock: bool,
     rate_limited_sources: set[str],
-    rate_limit_lock: threading.Lock,
     x_handle: str | None = None,
     x_related: list[str] | None = None,
-) -> None:
-    """Phase 2: extract entities from Phase 1 results, run targeted supplemental searches."""
+) -> dict[str, Any] | None:
+    """Phase 2 fetch: extract entities from Phase 1 X results and run targeted handle searches.
+
+    Only reads the X items already in the bundle, so ``run`` launches this as
+    soon as the Phase 1 X streams resolve, overlapping the remaining sources.
+    Returns None when there is nothing to search; merging is left to
+    ``_merge_supplemental_searches`` once Phase 1 is complete.
+    """
     if depth == "quick" or mock:
-        return
+        return None
 
-    from_date, to_date = date_range
+    # Handle search is the only Phase 2 action, so when it cannot run (X is
+    # rate-limited or the backend is not Bird) skip entity extraction entirely.
+    if "x" in rate_limited_sources:
+        return None
+
+    backend = runtime.x_search_backend or env.get_x_source(config)
+    if backend != "bird":
+        return None  # Handle search only works with Bird CLI
+
+    from_date, _to_date = date_range
 
     # Convert SourceItems to dicts for entity_extract
     x_dicts = [
         {"author_handle": item.author or "", "text": item.body or ""}
         for item in bundle.items_by_source.get("x", [])
     ]
-    reddit_dicts = [
-        {
-            "subreddit": item.container or "",
-            "comment_insights": item.metadata.get("comment_insights", []),
-            "top_comments": [
-                {"excerpt": c.get("excerpt", c.get("text", ""))}
-                for c in (item.metadata.get("top_comments") or [])
-                if isinstance(c, dict)
-            ],
-        }
-        for item in bundle.items_by_source.get("reddit", [])
-    ]
-
-    if not x_dicts and not reddit_dicts and not x_handle and not x_related:
-        return
 
-    entities = entity_extract.extract_entities(
-        reddit_dicts, x_dicts,
-        max_handles=3, max_subreddits=3,
-    )
+    if not x_dicts and not x_handle and not x_related:
+        return None
 
-    handles = entities.get("x_handles", [])
+    handles = entity_extract.extract_x_handles(x_dicts, max_handles=3)
 
     # Add explicit --x-handle if provided
     if x_handle:
@@ -638,15 +650,46 @@ def _run_supplemental_searches(
                 related_handles.append(rh_clean)
 
     if not handles and not related_handles:
-        return
+        return None
 
-    # Check if X is rate-limited
-    if "x" in rate_limited_sources:
-        return
+    # Primary and related handle searches are independent Bird calls, so run
+    # them side by side. Results are still merged primary-first so the related
+    # pass dedupes against primary URLs.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        primary_future = (
+            executor.submit(bird_x.search_handles, handles, topic, from_date, count_per=3)
+            if handles else None
+        )
+        related_future = (
+            executor.submit(bird_x.search_handles, related_handles, topic, from_date, count_per=3)
+            if related_handles else None
+        )
 
-    backend = runtime.x_search_backend or env.get_x_source(config)
-    if backend != "bird":
-        return  # Handle search only works with Bird CLI
+    def _outcome(future):
+        if future is None:
+            return [], None
+        try:
+            return future.result(), None
+        except Exception as exc:
+            return [], exc
+
+    return {
+        "related_handles": related_handles,
+        "primary": _outcome(primary_future),
+        "related": _outcome(related_future),
+    }
+
+
+def _merge_supplemental_searches(
+    *,
+    topic: str,
+    bundle: schema.RetrievalBundle,
+    plan: schema.QueryPlan,
+    date_range: tuple[str, str],
+    results: dict[str, Any],
+) -> None:
+    """Phase 2 merge: normalize handle-search results and dedupe them against Phase 1."""
+    from_date, to_date = date_range
 
     # Collect existing URLs for deduplication
     existing_urls = {
@@ -659,66 +702,53 @@ def _run_supplemental_searches(
     ranking_query = plan.subqueries[0].ranking_query if plan.subqueries else topic
     primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
 
+    def unseen(raw_items: list[dict]) -> list[schema.SourceItem]:
+        # Normalize a handle-search batch and keep only URLs not already in the bundle.
+        if not raw_items:
+            return []
+        normalized = _normalize_score_dedupe(
+            "x", raw_items, from_date, to_date,
+            freshness_mode=plan.freshness_mode,
+            ranking_query=ranking_query,
+        )
+        normalized = [item for item in normalized if item.url not in existing_urls]
+        existing_urls.update(item.url for item in normalized if item.url)
+        return normalized
+
     # Search primary handles (full weight)
-    if handles:
-        try:
-            raw_items = bird_x.search_handles(
-                handles, topic, from_date, count_per=3,
-            )
-        except Exception as exc:
-            print(f"[Pipeline] Phase 2 handle search failed: {exc}", file=sys.stderr)
-            if not bundle.items_by_source.get("x"):
-                bundle.errors_by_source["x"] = f"Phase 2 handle search: {exc}"
-            raw_items = []
-
-        if raw_items:
-            normalized = _normalize_score_dedupe(
-                "x", raw_items, from_date, to_date,
-                freshness_mode=plan.freshness_mode,
-                ranking_query=ranking_query,
-            )
-            # Deduplicate against Phase 1 URLs
-            normalized = [item for item in normalized if item.url not in existing_urls]
-            if normalized:
-                bundle.add_items(primary_label, "x", normalized)
-                # Update existing URLs for related-handle dedup
-                for item in normalized:
-                    if item.url:
-                        existing_urls.add(item.url)
+    raw_items, exc = results["primary"]
+    if exc is not None:
+        print(f"[Pipeline] Phase 2 handle search failed: {exc}", file=sys.stderr)
+        if not bundle.items_by_source.get("x"):
+            bundle.errors_by_source["x"] = f"Phase 2 handle search: {exc}"
 
-    # Search related handles with lower weight (0.3)
-    if related_handles:
-        try:
-            raw_items = bird_x.search_handles(
-                related_handles, topic, from_date, count_per=3,
-            )
-        except Exception as exc:
-            print(f"[Pipeline] Phase 2 related handle search failed: {exc}", file=sys.stderr)
-            raw_items = []
+    normalized = unseen(raw_items)
+    if normalized:
+        bundle.add_items(primary_label, "x", normalized)
 
-        if raw_items:
-            normalized = _normalize_score_dedupe(
-                "x", raw_items, from_date, to_date,
-                freshness_mode=plan.freshness_mode,
-                ranking_query=ranking_query,
+    # Search related handles with lower weight (0.3)
+    raw_items, exc = results["related"]
+    if exc is not None:
+        print(f"[Pipeline] Phase 2 related handle search failed: {exc}", file=sys.stderr)
+
+    # Deduplicated against Phase 1 and the primary-handle results above
+    normalized = unseen(raw_items)
+    if normalized:
+        related_handles = results["related_handles"]
+        # Use a separate subquery label with lower weight so RRF
+        # scores related-handle results below primary results.
+        bundle.add_items("supplemental-related", "x", normalized)
+        # Register the supplemental-related label in the plan for fusion
+        if not any(sq.label == "supplemental-related" for sq in plan.subqueries):
+            plan.subqueries.append(
+                schema.SubQuery(
+                    label="supplemental-related",
+                    search_query=", ".join(related_handles),
+                    ranking_query=ranking_query,
+                    sources=["x"],
+                    weight=0.3,
+                )
             )
-            # Deduplicate against all existing URLs (Phase 1 + primary handles)
-            normalized = [item for item in normalized if item.url not in existing_urls]
-            if normalized:
-                # Use a separate subquery label with lower weight so RRF
-                # scores related-handle results below primary results.
-                bundle.add_items("supplemental-related", "x", normalized)
-                # Register the supplemental-related label in the plan for fusion
-                if not any(sq.label == "supplemental-related" for sq in plan.subqueries):
-                    plan.subqueries.append(
-                        schema.SubQuery(
-                            label="supplemental-related",
-                            search_query=", ".join(related_handles),
-                            ranking_query=ranking_query,
-                            sources=["x"],
-                            weight=0.3,
-                        )
-                    )
 
 
 def _retry_thin_sources(
@@ -803,25 +833,98 @@ def _retry_thin_sources(
         return source, normalized[:settings["per_stream_limit"]]
 
     retryable = [s for s in thin_sources if s not in rate_limited_sources]
+    primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     with ThreadPoolExecutor(max_workers=min(4, len(retryable) or 1)) as executor:
         futures = {executor.submit(_retry_one_source, s): s for s in retryable}
         for future in as_completed(futures):
             source = futures[future]
             try:
                 source, normalized = future.result()
+                if not normalized:
+                    continue
                 existing_urls = {item.url for item in bundle.items_by_source.get(source, []) if item.url}
                 new_items = [item for item in normalized if item.url not in existing_urls]
 
                 if new_items:
                     bundle.items_by_source.setdefault(source, []).extend(new_items)
-                    primary_label = plan.subqueries[0].label if plan.subqueries else "primary"
                     bundle.items_by_source_and_query.setdefault((primary_label, source), []).extend(new_items)
             except Exception as exc:
                 print(f"[Pipeline] Retry failed for {source}: {type(exc).__name__}: {exc}", file=sys.stderr)
 
 
+def _search_github_custom(
+    *,
+    github_repos: list[str] | None,
+    github_user: str | None,
+    date_range: tuple[str, str],
+    depth: str,
+    token: str | None,
+    freshness_mode: str,
+) -> tuple[str | None, list[schema.SourceItem], str | None]:
+    """Run project-mode GitHub search, falling back to person-mode.
+
+    Returns ``(mode, items, error)`` where ``mode`` is ``"project"``,
+    ``"person"``, or None when neither produced items. A project-mode
+    failure is still reported when person mode succeeds.
+    """
+    from_date, to_date = date_range
+    error = None
+    # Project mode takes priority over person mode
+    if github_repos:
+        try:
+            project_items = github.search_github_project(
+                github_repos, from_date, to_date, depth=depth, token=token,
+            )
+            if project_items:
+                return "project", _normalize_score_dedupe(
+                    "github", project_items, from_date, to_date,
+                    freshness_mode=freshness_mode,
+                    ranking_query=f"What are {', '.join(github_repos)} doing on GitHub?",
+                ), None
+        except Exception as exc:
+            error = f"Project-mode failed: {exc}"
+    if github_user:
+        try:
+            person_items = github.search_github_person(
+                github_user, from_date, to_date, depth=depth, token=token,
+            )
+            if person_items:
+                return "person", _normalize_score_dedupe(
+                    "github", person_items, from_date, to_date,
+                    freshness_mode=freshness_mode,
+                    ranking_query=f"What is @{github_user} doing on GitHub?",
+                ), error
+        except Exception as exc:
+            error = f"Person-mode failed: {exc}"
+    return None, [], error
+
+
+def _retrieve_stream_after(
+    delay: float,
+    *,
+    freshness_mode: str,
+    per_stream_limit: int,
+    **kwargs: Any,
+) -> tuple[list[schema.SourceItem], dict]:
+    """Run ``_retrieve_stream`` after an optional backoff, on the worker thread.
+
+    The batch is normalized, scored and deduped here too, so that CPU work
+    overlaps with the other streams' network waits instead of queueing up
+    in the collector loop.
+    """
+    if delay:
+        time.sleep(delay)
+    raw_items, artifact = _retrieve_stream(**kwargs)
+    from_date, to_date = kwargs["date_range"]
+    normalized = _normalize_score_dedupe(
+        kwargs["source"], raw_items, from_date, to_date,
+        freshness_mode=freshness_mode,
+        ranking_query=kwargs["subquery"].ranking_query,
+    )
+    return normalized[:per_stream_limit], artifact
+
+
 def _retrieve_stream(
     *,
     topic: str,
@@ -914,7 +1017,7 @@ def _retrieve_stream(
         yt_query = raw_topic or subquery.search_query
         result = None
         # Try yt-dlp first, fall back to SC YouTube if it fails or isn't installed
-        if which("yt-dlp"):
+        if youtube_yt.is_ytdlp_installed():
             try:
                 result = youtube_yt.search_and_transcribe(yt_query, from_date, to_date, depth=depth)
             except Exception:
@@ -922,8 +1025,6 @@ def _retrieve_stream(
         if (result is None or not result.get("items")) and env.is_youtube_sc_available(config):
             sc_token = config.get("SCRAPECREATORS_API_KEY", "")
             result = youtube_yt.search_youtube_sc(yt_query, from_date, to_date, depth=depth, token=sc_token)
-        if result is None:
-            result = {"items": []}
         # Enrich top videos with comments when SC key is available
         items = youtube_yt.parse_youtube_response(result)
         if items and env.is_youtube_comments_available(config):
@@ -1016,52 +1117,58 @@ def _google_key(config: dict[str, Any]) -> str | None:
 
 
 
+@functools.lru_cache(maxsize=None)
+def _mock_date(days_ago: int) -> str:
+    return dates.get_date_range(days_ago)[0]
+
+
 def _mock_stream_results(source: str, subquery: schema.SubQuery) -> tuple[list[dict], dict]:
-    payloads = {
-        "reddit": [
+    """Build the mock payload for one stream; only the requested source is materialized."""
+    search_query = subquery.search_query
+    if source == "reddit":
+        return [
             {
                 "id": "R1",
-                "title": f"{subquery.search_query} discussion thread",
+                "title": f"{search_query} discussion thread",
                 "url": "https://reddit.com/r/example/comments/1",
                 "subreddit": "example",
-                "date": dates.get_date_range(5)[0],
+                "date": _mock_date(5),
                 "engagement": {"score": 120, "num_comments": 48, "upvote_ratio": 0.91},
-                "selftext": f"Community discussion about {subquery.search_query}.",
+                "selftext": f"Community discussion about {search_query}.",
                 "top_comments": [{"excerpt": "Strong firsthand feedback from users."}],
                 "relevance": 0.82,
                 "why_relevant": "Mock Reddit result",
             }
-        ],
-        "x": [
+        ], {}
+    if source == "x":
+        return [
             {
                 "id": "X1",
-                "text": f"People on X are discussing {subquery.search_query} right now.",
+                "text": f"People on X are discussing {search_query} right now.",
                 "url": "https://x.com/example/status/1",
                 "author_handle": "example",
-                "date": dates.get_date_range(2)[0],
+                "date": _mock_date(2),
                 "engagement": {"likes": 200, "reposts": 35, "replies": 18, "quotes": 4},
                 "relevance": 0.79,
                 "why_relevant": "Mock X result",
             }
-        ],
-        "grounding": [
+        ], {}
+    if source == "grounding":
+        return [
             {
                 "id": "WB1",
-                "title": f"{subquery.search_query} article",
+                "title": f"{search_query} article",
                 "url": "https://example.com/article",
                 "source_domain": "example.com",
-                "snippet": f"Recent web reporting about {subquery.search_query}.",
-                "date": dates.get_date_range(7)[0],
+                "snippet": f"Recent web reporting about {search_query}.",
+                "date": _mock_date(7),
                 "relevance": 0.88,
                 "why_relevant": "Brave web search",
             }
-        ],
-    }
-    if source == "grounding":
-        return payloads.get(source, []), {
+        ], {
             "label": subquery.label,
             "mock": True,
-            "webSearchQueries": [subquery.search_query],
+            "webSearchQueries": [search_query],
             "resultCount": 1,
         }
-    return payloads.get(source, []), {}
+    return [], {}
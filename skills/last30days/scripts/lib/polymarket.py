@@ -4,6 +4,7 @@ Uses gamma-api.polymarket.com for event/market discovery.
 No API key needed - public read-only API with generous rate limits (15K req/10s).
 """
 
+import functools
 import json
 import math
 import re
@@ -36,6 +37,7 @@ def _log(msg: str):
     log.source_log("PM", msg)
 
 
+@functools.lru_cache(maxsize=128)
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from topic string.
 
@@ -342,7 +344,7 @@ def _run_queries_parallel(
         for future in as_completed(futures):
             query_idx = futures[future]
             try:
-                response = future.result(timeout=15)
+                response = future.result()
                 if response.get("error"):
                     errors.append(response["error"])
 
@@ -1,6 +1,7 @@
 """Shared query preprocessing utilities: noise-word stripping, core subject
 extraction, and compound term detection. Used by all search modules."""
 
+import functools
 import re
 from typing import FrozenSet, List, Optional, Set
 
@@ -12,6 +13,10 @@ PREFIXES = [
     'what are', 'what is', 'tips for', 'best practices for',
 ]
 
+# One anchored alternation over PREFIXES; alternatives are tried in list
+# order, so the first listed prefix still wins.
+_PREFIX_RE = re.compile('^(?:' + '|'.join(map(re.escape, PREFIXES)) + ') ')
+
 # Multi-word suffixes (used by bird_x)
 SUFFIXES = [
     'best practices', 'use cases', 'prompt techniques',
@@ -44,6 +49,7 @@ NOISE_WORDS = frozenset({
 })
 
 
+@functools.lru_cache(maxsize=256)
 def extract_core_subject(
     topic: str,
     *,
@@ -55,6 +61,9 @@ def extract_core_subject(
 
     Strips common question/meta prefixes and noise words to produce a
     compact search-friendly query. Platforms customize via parameters.
+    Memoized: every source module and the planner/retry path derive the core
+    subject from the same topic, so repeat calls are a cache hit. ``noise``
+    must therefore be hashable (a frozenset).
 
     Args:
         topic: Raw user query
@@ -70,10 +79,9 @@ def extract_core_subject(
         return text
 
     # Phase 1: Strip multi-word prefixes (longest first, stop after first match)
-    for p in PREFIXES:
-        if text.startswith(p + ' '):
-            text = text[len(p):].strip()
-            break
+    prefix = _PREFIX_RE.match(text)
+    if prefix:
+        text = text[prefix.end():].strip()
 
     # Phase 2: Strip multi-word suffixes (opt-in)
     if strip_suffixes:
@@ -7,6 +7,7 @@ Requires SCRAPECREATORS_API_KEY in config (same key as TikTok + Instagram).
 API docs: https://scrapecreators.com/docs
 """
 
+import heapq
 import re
 import sys
 import time
@@ -586,8 +587,7 @@ def enrich_with_comments(
     # Select the top threads by total engagement (upvotes + comment count),
     # not by list position. This ensures high-comment threads like [FRESH ALBUM]
     # always get enriched even if their upvote score is low.
-    ranked = sorted(items, key=_total_engagement, reverse=True)
-    top_items = ranked[:max_comments]
+    top_items = heapq.nlargest(max_comments, items, key=_total_engagement)
     _log(f"Enriching comments for {len(top_items)} posts (by total engagement)")
 
     start = time.monotonic()
@@ -607,7 +607,7 @@ def enrich_with_comments(
         for future in done:
             item = futures[future]
             try:
-                raw_comments = future.result(timeout=0)
+                raw_comments = future.result()
             except Exception:
                 continue
             if not raw_comments:
@@ -695,9 +695,11 @@ def search_and_enrich(
     return result
 
 
-def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+def parse_reddit_response(response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Parse ScrapeCreators response to item list.
 
-    Parse raw Reddit search output into the generic item shape.
+    Parse raw Reddit search output into the generic item shape. Accepts None.
     """
+    if not response:
+        return []
     return response.get("items", [])
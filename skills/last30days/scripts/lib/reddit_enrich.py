@@ -5,6 +5,7 @@ Supports two backends:
 2. reddit.com/.json (fallback) - free but 429-prone
 """
 
+import heapq
 import re
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
@@ -138,10 +139,8 @@ def get_top_comments(comments: List[Dict], limit: int = 10) -> List[Dict[str, An
     # Filter out deleted/removed
     valid = [c for c in comments if c.get("author") not in ("[deleted]", "[removed]")]
 
-    # Sort by score descending
-    sorted_comments = sorted(valid, key=lambda c: c.get("score", 0), reverse=True)
-
-    return sorted_comments[:limit]
+    # Highest-scoring first
+    return heapq.nlargest(limit, valid, key=lambda c: c.get("score", 0))
 
 
 def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
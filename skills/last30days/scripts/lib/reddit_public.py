@@ -11,15 +11,20 @@ Handles 429 rate limits with exponential backoff, HTML anti-bot responses,
 network timeouts, and missing subreddits.
 """
 
+import concurrent.futures
 import json
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from . import reddit_enrich
+
 
 USER_AGENT = "last30days/3.0 (research tool)"
 
@@ -40,6 +45,15 @@ ENRICH_LIMITS = {
 MAX_RETRIES = 3
 BASE_BACKOFF = 2.0  # seconds
 
+# Comment enrichment runs on one shared pool so concurrent Reddit streams
+# (one per planner subquery) stay within a global cap on thread fetches
+# instead of each stacking its own executor on top of the search pool.
+ENRICH_WORKERS = 4
+ENRICH_BUDGET = 45  # seconds per _enrich_posts call
+
+_enrich_pool: Optional[ThreadPoolExecutor] = None
+_enrich_pool_lock = threading.Lock()
+
 
 def _log(msg: str):
     """Log to stderr."""
@@ -139,7 +153,6 @@ def _parse_posts(data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
         date_str = None
         if created_utc:
             try:
-                from datetime import datetime, timezone
                 dt = datetime.fromtimestamp(float(created_utc), tz=timezone.utc)
                 date_str = dt.strftime("%Y-%m-%d")
             except (ValueError, TypeError, OSError):
@@ -177,6 +190,16 @@ def _compute_relevance(score: int, num_comments: int) -> float:
     return round((score_component * 0.6) + (comments_component * 0.4), 3)
 
 
+def _dedupe_by_url(posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated URLs, keeping the first occurrence of each."""
+    seen_urls: set = set()
+    seen_add = seen_urls.add
+    return [
+        post for post in posts
+        if post["url"] not in seen_urls and not seen_add(post["url"])
+    ]
+
+
 def search(
     query: str,
     depth: str = "default",
@@ -213,12 +236,7 @@ def search(
     posts = _parse_posts(data)
 
     # Dedupe by URL and assign IDs
-    seen_urls = set()
-    unique = []
-    for post in posts:
-        if post["url"] not in seen_urls:
-            seen_urls.add(post["url"])
-            unique.append(post)
+    unique = _dedupe_by_url(posts)
 
     for i, post in enumerate(unique):
         post["id"] = f"R{i + 1}"
@@ -227,66 +245,77 @@ def search(
 
 
 def _enrich_post(item: Dict[str, Any], timeout: int = 10) -> Dict[str, Any]:
-    """Enrich a single post with top comments. Never raises."""
+    """Enrich a single post with top comments. Never raises.
+
+    Returns a copy so a fetch that outlives the caller's budget cannot mutate
+    a post the pipeline is already normalizing.
+    """
     try:
-        from . import reddit_enrich
         thread_data = reddit_enrich.fetch_thread_data(item["url"], timeout=timeout)
         if not thread_data:
             return item
         parsed = reddit_enrich.parse_thread_data(thread_data)
         comments = parsed.get("comments", [])
         top = reddit_enrich.get_top_comments(comments)
-        item["top_comments"] = [
-            {
-                "score": c.get("score", 0),
-                "excerpt": (c.get("body") or "")[:200],
-                "author": c.get("author", ""),
-            }
-            for c in top[:10]
-        ]
+        return {
+            **item,
+            "top_comments": [
+                {
+                    "score": c.get("score", 0),
+                    "excerpt": (c.get("body") or "")[:200],
+                    "author": c.get("author", ""),
+                }
+                for c in top[:10]
+            ],
+        }
     except Exception:
         # Never discard — keep post with empty metadata
         pass
     return item
 
 
+def _get_enrich_pool() -> ThreadPoolExecutor:
+    """Return the shared comment-enrichment executor, creating it on first use."""
+    global _enrich_pool
+    if _enrich_pool is None:
+        with _enrich_pool_lock:
+            if _enrich_pool is None:
+                _enrich_pool = ThreadPoolExecutor(
+                    max_workers=ENRICH_WORKERS, thread_name_prefix="reddit-enrich",
+                )
+    return _enrich_pool
+
+
 def _enrich_posts(posts: List[Dict[str, Any]], depth: str = "default") -> List[Dict[str, Any]]:
-    """Enrich top N posts with comment data using threads. Total budget 45s."""
-    limit = ENRICH_LIMITS.get(depth, ENRICH_LIMITS["default"])
-    to_enrich = posts[:limit]
-    rest = posts[limit:]
+    """Enrich top N posts with comment data on the shared pool. Total budget 45s.
 
-    if not to_enrich:
+    Enriched copies are written back into ``posts`` by index; posts whose
+    fetch fails or misses the budget stay as they were.
+    """
+    enrich_count = min(ENRICH_LIMITS.get(depth, ENRICH_LIMITS["default"]), len(posts))
+    if not enrich_count:
         return posts
 
-    enriched = []
     try:
-        with ThreadPoolExecutor(max_workers=min(limit, 4)) as executor:
-            futures = {
-                executor.submit(_enrich_post, post, 10): i
-                for i, post in enumerate(to_enrich)
-            }
-            # Collect results with 45s total budget
-            import concurrent.futures
-            done, not_done = concurrent.futures.wait(futures, timeout=45)
-            # Build result list preserving order
-            result_map: Dict[int, Dict[str, Any]] = {}
-            for future in done:
-                idx = futures[future]
-                try:
-                    result_map[idx] = future.result(timeout=0)
-                except Exception:
-                    result_map[idx] = to_enrich[idx]
-            # Any not-done futures: keep original post
-            for future in not_done:
-                idx = futures[future]
-                result_map[idx] = to_enrich[idx]
-                future.cancel()
-            enriched = [result_map[i] for i in range(len(to_enrich))]
+        pool = _get_enrich_pool()
+        futures = {
+            pool.submit(_enrich_post, posts[i], 10): i
+            for i in range(enrich_count)
+        }
+        # Collect results with 45s total budget
+        done, not_done = concurrent.futures.wait(futures, timeout=ENRICH_BUDGET)
+        for future in done:
+            try:
+                posts[futures[future]] = future.result()
+            except Exception:
+                pass
+        # Any not-done futures: keep original post
+        for future in not_done:
+            future.cancel()
     except Exception:
-        enriched = to_enrich
+        pass
 
-    return enriched + rest
+    return posts
 
 
 def _search_subreddit(sub: str, topic: str, depth: str, timeout: int = 15) -> List[Dict[str, Any]]:
@@ -347,12 +376,7 @@ def search_reddit_public(
     all_posts.extend(global_posts)
 
     # Deduplicate by URL (targeted results keep priority since they come first)
-    seen_urls: set = set()
-    results: List[Dict[str, Any]] = []
-    for post in all_posts:
-        if post["url"] not in seen_urls:
-            seen_urls.add(post["url"])
-            results.append(post)
+    results = _dedupe_by_url(all_posts)
 
     # Date filter: keep posts in range or with unknown dates
     filtered = []
@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
+import functools
+import re
+
 from . import relevance, schema
 
 
+@functools.lru_cache(maxsize=8)
+def _word_limit_re(max_words: int) -> re.Pattern[str]:
+    # Matches up to the start of word max_words + 1, so only over-long text matches.
+    return re.compile(r"\s*(?:\S+\s+){%d}(?=\S)" % max_words)
+
+
+def truncate_words(text: str, max_words: int) -> str:
+    """Cap ``text`` at ``max_words`` words, appending ``...`` when cut.
+
+    The cut point is found with one anchored regex scan, so long text only
+    pays for the words it keeps rather than splitting the whole string.
+    Text within the limit is returned unchanged; a cut prefix is
+    whitespace-normalized, matching ``" ".join(text.split()[:max_words])``.
+    """
+    cut = _word_limit_re(max_words).match(text)
+    if cut is None:
+        return text
+    return " ".join(text[:cut.end()].split()) + "..."
+
+
 def _truncate_words(text: str, max_words: int) -> str:
-    words = text.split()
-    if len(words) <= max_words:
-        return text.strip()
-    return " ".join(words[:max_words]).strip() + "..."
+    return truncate_words(text, max_words).strip()
 
 
 def _windows(words: list[str], size: int, overlap: int) -> list[str]:
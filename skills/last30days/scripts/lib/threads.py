@@ -10,8 +10,10 @@ API docs: https://scrapecreators.com/docs
 import math
 import re
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 from . import dates, http, log
+from .query import extract_core_subject
 from .relevance import token_overlap_relevance as _compute_relevance
 
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com/v1/threads"
@@ -28,15 +30,16 @@ def _log(msg: str):
     log.source_log("Threads", msg)
 
 
+_THREADS_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features', 'recommendations', 'advice',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Threads search."""
-    from .query import extract_core_subject
-    _THREADS_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features', 'recommendations', 'advice',
-    })
     return extract_core_subject(topic, noise=_THREADS_NOISE)
 
 
@@ -151,15 +154,10 @@ def search_threads(
 
     _log(f"Searching for '{core_topic}' (depth={depth}, limit={config['results']})")
 
-    try:
-        import requests as _requests
-    except ImportError:
-        _requests = None
-
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         _log("requests library not installed, falling back to urllib")
         try:
-            from urllib.parse import urlencode
             params = urlencode({"keyword": core_topic})
             url = f"{SCRAPECREATORS_BASE}/search?{params}"
             headers = http.scrapecreators_headers(token)
@@ -170,7 +168,7 @@ def search_threads(
             return {"items": [], "error": f"{type(e).__name__}: {e}"}
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/search",
                 params={"keyword": core_topic},
                 headers=http.scrapecreators_headers(token),
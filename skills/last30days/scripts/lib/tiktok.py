@@ -7,16 +7,16 @@ Requires SCRAPECREATORS_API_KEY in config. 100 free API calls, then PAYG.
 API docs: https://scrapecreators.com/docs
 """
 
+import heapq
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Set
-
-try:
-    import requests as _requests
-except ImportError:
-    _requests = None
+from urllib.parse import urlencode
 
 from . import dates, http, log
+from .query import extract_core_subject
+from .snippet import truncate_words
 
 SCRAPECREATORS_BASE = "https://api.scrapecreators.com/v1/tiktok"
 
@@ -33,18 +33,19 @@ CAPTION_MAX_WORDS = 500
 from .relevance import token_overlap_relevance as _compute_relevance
 
 
+_TIKTOK_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome', 'killer',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features',
+    'recommendations', 'advice',
+    'prompt', 'prompts', 'prompting',
+    'methods', 'strategies', 'approaches',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for TikTok search."""
-    from .query import extract_core_subject
-    _TIKTOK_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome', 'killer',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features',
-        'recommendations', 'advice',
-        'prompt', 'prompts', 'prompting',
-        'methods', 'strategies', 'approaches',
-    })
     return extract_core_subject(topic, noise=_TIKTOK_NOISE)
 
 
@@ -214,9 +215,9 @@ def _hashtag_search(
         List of raw TikTok item dicts (aweme_info format).
     """
     _log(f"Hashtag search: #{hashtag}")
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"hashtag": hashtag})
             url = f"{SCRAPECREATORS_BASE}/search/hashtag?{params}"
             headers = http.scrapecreators_headers(token)
@@ -227,7 +228,7 @@ def _hashtag_search(
             return []
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/search/hashtag",
                 params={"hashtag": hashtag},
                 headers=http.scrapecreators_headers(token),
@@ -261,9 +262,9 @@ def _profile_videos(
     """
     _log(f"Profile videos: @{handle}")
     profile_url = "https://api.scrapecreators.com/v3/tiktok/profile/videos"
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"handle": handle, "sort_by": "latest"})
             url = f"{profile_url}?{params}"
             headers = http.scrapecreators_headers(token)
@@ -274,7 +275,7 @@ def _profile_videos(
             return []
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 profile_url,
                 params={"handle": handle, "sort_by": "latest"},
                 headers=http.scrapecreators_headers(token),
@@ -318,10 +319,10 @@ def search_tiktok(
 
     _log(f"Searching TikTok for '{core_topic}' (depth={depth}, count={config['results_per_page']})")
 
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         _log("requests library not installed, falling back to urllib")
         try:
-            from urllib.parse import urlencode
             params = urlencode({"query": core_topic, "sort_by": "relevance"})
             url = f"{SCRAPECREATORS_BASE}/search/keyword?{params}"
             headers = http.scrapecreators_headers(token)
@@ -332,7 +333,7 @@ def search_tiktok(
             return {"items": [], "error": f"{type(e).__name__}: {e}"}
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/search/keyword",
                 params={"query": core_topic, "sort_by": "relevance"},
                 headers=http.scrapecreators_headers(token),
@@ -397,7 +398,8 @@ def fetch_captions(
     config = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
     max_captions = config["max_captions"]
 
-    if not video_items or not token or not _requests:
+    session = http.get_session()
+    if not video_items or not token or session is None:
         return {}
 
     top_items = video_items[:max_captions]
@@ -410,9 +412,7 @@ def fetch_captions(
         vid = item["video_id"]
         text = item.get("text", "")
         if text:
-            words = text.split()
-            if len(words) > CAPTION_MAX_WORDS:
-                text = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
+            text = truncate_words(text, CAPTION_MAX_WORDS)
             captions[vid] = text
 
     # Second pass: try to get spoken-word transcripts (1 credit each)
@@ -422,7 +422,7 @@ def fetch_captions(
         if not url:
             continue
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/video/transcript",
                 params={"url": url},
                 headers=http.scrapecreators_headers(token),
@@ -436,9 +436,7 @@ def fetch_captions(
                         transcript = " ".join(str(s) for s in transcript)
                     transcript = _clean_webvtt(transcript)
                     if transcript:
-                        words = transcript.split()
-                        if len(words) > CAPTION_MAX_WORDS:
-                            transcript = ' '.join(words[:CAPTION_MAX_WORDS]) + '...'
+                        transcript = truncate_words(transcript, CAPTION_MAX_WORDS)
                         captions[vid] = transcript
         except Exception as e:
             _log(f"Transcript fetch failed for {vid}: {e}")
@@ -571,12 +569,9 @@ def enrich_with_comments(
     if not items or not token or max_posts <= 0:
         return items
 
-    ranked = sorted(items, key=_tiktok_total_engagement, reverse=True)
-    top_items = ranked[:max_posts]
+    top_items = heapq.nlargest(max_posts, items, key=_tiktok_total_engagement)
     _log(f"Enriching comments for {len(top_items)} TikTok posts")
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     def _enrich_one(item: dict) -> bool:
         post_url = item.get("url", "")
         if not post_url:
@@ -620,9 +615,9 @@ def _fetch_post_comments(
         List of comment dicts with author, text, digg_count (likes), date.
         Empty list on any error — comment failures never crash the pipeline.
     """
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"url": post_url, "trim": "true"})
             url = f"{SCRAPECREATORS_BASE}/video/comments?{params}"
             headers = http.scrapecreators_headers(token)
@@ -633,7 +628,7 @@ def _fetch_post_comments(
             return []
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_BASE}/video/comments",
                 params={"url": post_url, "trim": "true"},
                 headers=http.scrapecreators_headers(token),
@@ -8,8 +8,10 @@ import math
 import re
 import sys
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 
 from . import http, log
+from .query import extract_core_subject
 
 TRUTHSOCIAL_SEARCH_URL = "https://truthsocial.com/api/v2/search"
 
@@ -31,15 +33,16 @@ def _strip_html(html: str) -> str:
     return text.strip()
 
 
+_TS_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features', 'recommendations', 'advice',
+})
+
+
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject from verbose query for Truth Social search."""
-    from .query import extract_core_subject
-    _TS_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features', 'recommendations', 'advice',
-    })
     return extract_core_subject(topic, noise=_TS_NOISE)
 
 
@@ -84,7 +87,6 @@ def search_truthsocial(
 
     _log(f"Searching for '{core_topic}' (depth={depth}, limit={count})")
 
-    from urllib.parse import urlencode
     params = {
         "q": core_topic,
         "type": "statuses",
@@ -1,7 +1,6 @@
 """xAI API client for X (Twitter) discovery."""
 
 import json
-import re
 import sys
 from typing import Any, Dict, List, Optional
 
@@ -24,6 +23,52 @@ def _log(msg: str):
 def _log_error(msg: str):
     log.source_log("xAI ERROR", msg, tty_only=False)
 
+def _is_iso_date(value: str) -> bool:
+    """True for a bare ``YYYY-MM-DD`` string; plain character tests, no regex."""
+    return (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    )
+
+
+def _extract_json_object(text: str, key: str = '"items"') -> Optional[str]:
+    """Return the first balanced ``{...}`` span in ``text`` that mentions ``key``.
+
+    A single left-to-right pass that tracks brace depth and skips braces
+    inside string literals, so large model output is never backtracked over.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            if depth:
+                in_string = True
+        elif ch == "{":
+            if not depth:
+                start = i
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if not depth:
+                candidate = text[start:i + 1]
+                if key in candidate:
+                    return candidate
+    return None
+
+
 # xAI uses responses endpoint with Agent Tools API
 XAI_RESPONSES_URL = "https://api.x.ai/v1/responses"
 
@@ -125,16 +170,18 @@ def search_x(
     return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
 
 
-def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+def parse_x_response(response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Parse xAI response to extract X items.
 
     Args:
-        response: Raw API response
+        response: Raw API response, or None
 
     Returns:
         List of item dicts
     """
     items = []
+    if not response:
+        return items
 
     # Check for API errors first
     if "error" in response and response["error"]:
@@ -178,10 +225,10 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         return items
 
     # Extract JSON from the response
-    json_match = re.search(r'\{[\s\S]*"items"[\s\S]*\}', output_text)
-    if json_match:
+    json_text = _extract_json_object(output_text)
+    if json_text:
         try:
-            data = json.loads(json_match.group())
+            data = json.loads(json_text)
             items = data.get("items", [])
         except json.JSONDecodeError:
             _log(f"Failed to parse xAI response JSON: {output_text[:200]}")
@@ -220,7 +267,7 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
 
         # Validate date format
         if clean_item["date"]:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
+            if not _is_iso_date(str(clean_item["date"])):
                 clean_item["date"] = None
 
         clean_items.append(clean_item)
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import Any, Dict, List
+from urllib.parse import quote
 
 from . import http, log
+from .query import extract_compound_terms, extract_core_subject
 from .relevance import token_overlap_relevance as _compute_relevance
 
 # Depth configurations: number of results to request per query
@@ -29,7 +31,6 @@ def _log(msg: str):
 
 def _extract_core_subject(topic: str) -> str:
     """Extract core subject for X search queries."""
-    from .query import extract_core_subject
     return extract_core_subject(topic, max_words=5, strip_suffixes=True)
 
 
@@ -52,7 +53,6 @@ def expand_xquik_queries(topic: str, depth: str) -> List[str]:
 
     # Add compound term variant for deep searches
     if len(queries) < 3:
-        from .query import extract_compound_terms
         compounds = extract_compound_terms(topic)
         if compounds:
             or_parts = " OR ".join(f'"{t}"' for t in compounds[:3])
@@ -223,5 +223,4 @@ def _safe_int(value: Any) -> int | None:
 
 def _url_encode(text: str) -> str:
     """URL-encode a string using stdlib."""
-    from urllib.parse import quote
     return quote(text, safe="")
@@ -95,7 +95,7 @@ def search_x(
 
 
 def parse_x_response(
-    response: Dict[str, Any],
+    response: Optional[Dict[str, Any]],
     topic: str = "",
 ) -> List[Dict[str, Any]]:
     """Parse xurl search response into normalized item dicts.
@@ -104,13 +104,15 @@ def parse_x_response(
     id, text, url, author_handle, date, engagement, why_relevant, relevance.
 
     Args:
-        response: Raw X API v2 response dict from search_x()
+        response: Raw X API v2 response dict from search_x(), or None
         topic: Original search topic (used for relevance scoring)
 
     Returns:
         List of item dicts.  Empty list on error or no results.
     """
     items: List[Dict[str, Any]] = []
+    if not response:
+        return items
 
     if "error" in response:
         _log(f"Error in response: {response['error']}")
@@ -6,6 +6,11 @@ transcript extraction. No API keys needed — just have yt-dlp installed.
 Inspired by Peter Steinberger's toolchain approach (yt-dlp + summarize CLI).
 """
 
+import atexit
+import functools
+import heapq
+import importlib.util
+import itertools
 import json
 import math
 import os
@@ -15,11 +20,12 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
 
 # Depth configurations: how many videos to search / transcribe
 DEPTH_CONFIG = {
@@ -37,10 +43,45 @@ TRANSCRIPT_LIMITS = {
 # Max words to keep from each transcript
 TRANSCRIPT_MAX_WORDS = 5000
 
+# Shared scratch directory for yt-dlp subtitle files (see _transcript_tmpdir)
+_transcript_root: Optional[str] = None
+_transcript_root_lock = threading.Lock()
+
+# Buffer size for streaming subtitle files off disk
+VTT_READ_BUFFER = 65536
+
+# yt-dlp search timeout in seconds
+SEARCH_TIMEOUT = 120
+
+# Searches larger than this are split into concurrent slices of this size
+SEARCH_SHARD_SIZE = 10
+
+# Max yt-dlp runs (subprocesses or in-process extractions) in flight at once,
+# across every caller: queries, search shards and transcript groups nest
+YTDLP_MAX_CONCURRENT = 4
+_ytdlp_slots = threading.BoundedSemaphore(YTDLP_MAX_CONCURRENT)
+
+# Batched yt-dlp transcript run: base timeout plus an allowance per video
+TRANSCRIPT_TIMEOUT = 30
+TRANSCRIPT_TIMEOUT_PER_VIDEO = 5
+
 from . import http, log
+from .query import extract_core_subject
 from .relevance import token_overlap_relevance as _compute_relevance
 
 
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_FILLER_RE = re.compile(
+    r"^(hey |hi |what's up|welcome back|in today's video|don't forget to)"
+    r"|(subscribe|like and comment|hit the bell|check out the link|down below)"
+    r"|^(so |and |but |okay |alright |um |uh )"
+    r"|(thanks for watching|see you (next|in the)|bye)",
+    re.IGNORECASE,
+)
+_DIGIT_RE = re.compile(r'\d')
+_CAPITALIZED_RE = re.compile(r'[A-Z][a-z]+')
+
+
 def extract_transcript_highlights(transcript: str, topic: str, limit: int = 5) -> list[str]:
     """Extract quotable highlights from a YouTube transcript.
 
@@ -51,7 +92,7 @@ def extract_transcript_highlights(transcript: str, topic: str, limit: int = 5) -
     if not transcript:
         return []
 
-    sentences = re.split(r'(?<=[.!?])\s+', transcript)
+    sentences = _SENTENCE_SPLIT_RE.split(transcript)
 
     # Fallback for punctuation-free transcripts (common with auto-captions):
     # chunk into ~20-word segments so they pass the 8-50 word filter.
@@ -59,13 +100,6 @@ def extract_transcript_highlights(transcript: str, topic: str, limit: int = 5) -
         words = transcript.split()
         sentences = [' '.join(words[i:i+20]) for i in range(0, len(words), 20)]
 
-    filler = [
-        r"^(hey |hi |what's up|welcome back|in today's video|don't forget to)",
-        r"(subscribe|like and comment|hit the bell|check out the link|down below)",
-        r"^(so |and |but |okay |alright |um |uh )",
-        r"(thanks for watching|see you (next|in the)|bye)",
-    ]
-
     topic_words = [w.lower() for w in topic.lower().split() if len(w) > 2]
 
     candidates = []
@@ -74,13 +108,13 @@ def extract_transcript_highlights(transcript: str, topic: str, limit: int = 5) -
         words = sent.split()
         if len(words) < 8 or len(words) > 50:
             continue
-        if any(re.search(p, sent, re.IGNORECASE) for p in filler):
+        if _FILLER_RE.search(sent):
             continue
 
         score = 0
-        if re.search(r'\d', sent):
+        if _DIGIT_RE.search(sent):
             score += 2
-        if re.search(r'[A-Z][a-z]+', sent):
+        if _CAPITALIZED_RE.search(sent):
             score += 1
         if '?' in sent:
             score += 1
@@ -98,9 +132,103 @@ def _log(msg: str):
     log.source_log("YouTube", msg, tty_only=False)
 
 
+@functools.lru_cache(maxsize=1)
 def is_ytdlp_installed() -> bool:
-    """Check if yt-dlp is available in PATH."""
-    return shutil.which("yt-dlp") is not None
+    """Check if yt-dlp is available in PATH or as an importable module."""
+    return shutil.which("yt-dlp") is not None or importlib.util.find_spec("yt_dlp") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _ytdlp_api():
+    """Return the yt_dlp module when importable, else None.
+
+    Running yt-dlp in-process skips a fork, a Python startup and yt-dlp's
+    own import for every call, and hands back info dicts without a JSON
+    round-trip through stdout. Installs without the module (e.g. Homebrew)
+    keep using the binary.
+    """
+    try:
+        import yt_dlp
+    except ImportError:
+        return None
+    return yt_dlp
+
+
+class _YDLLogger:
+    """Send in-process yt-dlp output to the debug log.
+
+    The binary's stderr is discarded, and with ignoreerrors yt-dlp would
+    otherwise print per-video errors straight to the user's terminal.
+    """
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        log.debug(f"yt-dlp: {msg}")
+
+    def error(self, msg: str) -> None:
+        log.debug(f"yt-dlp: {msg}")
+
+
+# Shared YoutubeDL options mirroring the CLI flags (--ignore-config is the
+# API default; cookies are never read from the browser).
+_YDL_BASE_OPTS = {
+    "logger": _YDLLogger(),
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "ignoreerrors": True,
+    "skip_download": True,
+    "socket_timeout": 30,
+}
+
+
+def _in_background(fn: Callable[[], Any]) -> Future:
+    """Start ``fn()`` on a daemon thread and return a Future for its result.
+
+    In-process yt-dlp calls cannot be interrupted, so callers bound them by
+    waiting on the future with a timeout, like the binary's kill timers. A
+    worker left running past its timeout never holds up interpreter exit.
+    Blocks until a yt-dlp slot is free; the worker holds it until ``fn``
+    returns, so abandoned workers still count against the cap.
+    """
+    future: Future = Future()
+    _ytdlp_slots.acquire()
+
+    def _run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            _ytdlp_slots.release()
+
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
+# YouTube-specific noise set: smaller than default, keeps content-type words
+_YT_NOISE = frozenset({
+    'best', 'top', 'good', 'great', 'awesome', 'killer',
+    'latest', 'new', 'news', 'update', 'updates',
+    'trending', 'hottest', 'popular', 'viral',
+    'practices', 'features',
+    'recommendations', 'advice',
+    'prompt', 'prompts', 'prompting',
+    'methods', 'strategies', 'approaches',
+    # Temporal/meta words — planner generates these but they don't
+    # appear in YouTube titles, so strip them for better search.
+    'last', 'days', 'recent', 'recently', 'month', 'week',
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+    '2025', '2026', '2027',
+    'music', 'public', 'appearances', 'developments', 'discussions', 'coverage',
+})
 
 
 def _extract_core_subject(topic: str) -> str:
@@ -109,38 +237,24 @@ def _extract_core_subject(topic: str) -> str:
     NOTE: 'tips', 'tricks', 'tutorial', 'guide', 'review', 'reviews'
     are intentionally KEPT — they're YouTube content types that improve search.
     """
-    from .query import extract_core_subject
-    # YouTube-specific noise set: smaller than default, keeps content-type words
-    _YT_NOISE = frozenset({
-        'best', 'top', 'good', 'great', 'awesome', 'killer',
-        'latest', 'new', 'news', 'update', 'updates',
-        'trending', 'hottest', 'popular', 'viral',
-        'practices', 'features',
-        'recommendations', 'advice',
-        'prompt', 'prompts', 'prompting',
-        'methods', 'strategies', 'approaches',
-        # Temporal/meta words — planner generates these but they don't
-        # appear in YouTube titles, so strip them for better search.
-        'last', 'days', 'recent', 'recently', 'month', 'week',
-        'january', 'february', 'march', 'april', 'may', 'june',
-        'july', 'august', 'september', 'october', 'november', 'december',
-        '2025', '2026', '2027',
-        'music', 'public', 'appearances', 'developments', 'discussions', 'coverage',
-    })
     return extract_core_subject(topic, noise=_YT_NOISE)
 
 
+# Checked in order; the first match wins
+_QUERY_INTENTS = (
+    ("comparison", re.compile(r"\b(vs|versus|compare|difference between)\b")),
+    ("how_to", re.compile(r"\b(how to|tutorial|guide|setup|step by step|deploy|install|configure|troubleshoot|error|fix|debug)\b")),
+    ("opinion", re.compile(r"\b(thoughts on|worth it|should i|opinion|review)\b")),
+    ("product", re.compile(r"\b(pricing|feature|features|best .* for)\b")),
+)
+
+
 def _infer_query_intent(topic: str) -> str:
     """Tiny local intent classifier for YouTube query expansion."""
     text = topic.lower().strip()
-    if re.search(r"\b(vs|versus|compare|difference between)\b", text):
-        return "comparison"
-    if re.search(r"\b(how to|tutorial|guide|setup|step by step|deploy|install|configure|troubleshoot|error|fix|debug)\b", text):
-        return "how_to"
-    if re.search(r"\b(thoughts on|worth it|should i|opinion|review)\b", text):
-        return "opinion"
-    if re.search(r"\b(pricing|feature|features|best .* for)\b", text):
-        return "product"
+    for intent, pattern in _QUERY_INTENTS:
+        if pattern.search(text):
+            return intent
     return "breaking_news"
 
 
@@ -188,6 +302,179 @@ def expand_youtube_queries(topic: str, depth: str) -> List[str]:
     return queries[:cap]
 
 
+def _terminate(proc: subprocess.Popen) -> None:
+    """Terminate a yt-dlp process group, falling back to killing the process."""
+    try:
+        os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+    except (ProcessLookupError, PermissionError, OSError):
+        proc.kill()
+
+
+_SEARCH_FIELDS = (
+    "id", "title", "channel", "uploader", "upload_date", "description",
+    "view_count", "like_count", "comment_count", "duration",
+)
+_SEARCH_PRINT_TEMPLATE = "%(.{" + ",".join(_SEARCH_FIELDS) + "})j"
+
+
+def _search_videos(
+    search_url: str,
+    playlist_items: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run a yt-dlp search and return ``(video info dicts, error)``.
+
+    Uses the yt_dlp module in-process when available, else the binary.
+    ``playlist_items`` (e.g. ``"11-20"``) limits the run to a slice of the
+    search results.
+    """
+    yt_dlp = _ytdlp_api()
+    if yt_dlp is not None:
+        opts = dict(_YDL_BASE_OPTS)
+        if playlist_items:
+            opts["playlist_items"] = playlist_items
+
+        def _extract():
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                return ydl.extract_info(search_url, download=False)
+
+        try:
+            result = _in_background(_extract).result(timeout=SEARCH_TIMEOUT)
+        except FuturesTimeoutError:
+            _log(f"YouTube search timed out ({SEARCH_TIMEOUT}s)")
+            return [], "Search timed out"
+        except yt_dlp.utils.DownloadError as exc:
+            _log(f"YouTube search failed: {exc}")
+            return [], "Search failed"
+        if result is None:
+            # With ignoreerrors, a failed extraction comes back as None.
+            _log("YouTube search failed: no results extracted")
+            return [], "Search failed"
+        return [video for video in result.get("entries") or [] if video], None
+
+    # yt-dlp search with full metadata (no --flat-playlist so dates are real).
+    # NOTE: --dateafter intentionally omitted — YouTube search returns
+    # relevance-sorted results and strict date filtering returns 0 for
+    # evergreen topics. Python soft filter (below) handles date filtering.
+    cmd = [
+        "yt-dlp",
+        "--ignore-config",
+        "--no-cookies-from-browser",
+        search_url,
+        # Only the fields _video_item reads, as one JSON object per line;
+        # --dump-json would ship every format and thumbnail per video.
+        "--print", _SEARCH_PRINT_TEMPLATE,
+        "--no-warnings",
+        "--no-download",
+    ]
+    if playlist_items:
+        cmd.extend(["--playlist-items", playlist_items])
+
+    preexec = os.setsid if hasattr(os, 'setsid') else None
+
+    with _ytdlp_slots:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                preexec_fn=preexec,
+            )
+        except FileNotFoundError:
+            return [], "yt-dlp not found"
+
+        # Parse each video's JSON line as yt-dlp emits it instead of waiting for
+        # the whole search; a watchdog enforces the timeout meanwhile. Blank or
+        # garbled lines raise JSONDecodeError or UnicodeDecodeError (ValueErrors).
+        timed_out = threading.Event()
+
+        def _on_timeout():
+            timed_out.set()
+            _terminate(proc)
+
+        watchdog = threading.Timer(SEARCH_TIMEOUT, _on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        videos = []
+        try:
+            for line in proc.stdout:
+                try:
+                    videos.append(json.loads(line))
+                except ValueError:
+                    continue
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+            proc.wait()
+
+    if timed_out.is_set():
+        _log(f"YouTube search timed out ({SEARCH_TIMEOUT}s)")
+        return [], "Search timed out"
+    return videos, None
+
+
+def _search_sharded(search_url: str, count: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run a large search as concurrent slices of SEARCH_SHARD_SIZE results.
+
+    yt-dlp extracts each result's full metadata one video at a time, so a
+    deep search is a chain of round-trips; slicing it with playlist items
+    overlaps them, up to YTDLP_MAX_CONCURRENT runs at a time. Results come
+    back in search order, deduped by id. The search only fails if every
+    slice does.
+    """
+    if count <= SEARCH_SHARD_SIZE:
+        return _search_videos(search_url)
+
+    shards = [
+        f"{start}-{min(start + SEARCH_SHARD_SIZE - 1, count)}"
+        for start in range(1, count + 1, SEARCH_SHARD_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        results = list(executor.map(lambda items: _search_videos(search_url, items), shards))
+
+    by_id: Dict[str, Dict[str, Any]] = {}
+    errors = []
+    for videos, error in results:
+        if error:
+            errors.append(error)
+        for video in videos:
+            by_id.setdefault(video.get("id", ""), video)
+    if errors and len(errors) == len(results):
+        return [], errors[0]
+    return list(by_id.values()), None
+
+
+def _video_item(video: Dict[str, Any], core_topic: str) -> Dict[str, Any]:
+    """Normalize one yt-dlp video info dict into a search item."""
+    video_id = video.get("id", "")
+    view_count = video.get("view_count") if video.get("view_count") is not None else 0
+    like_count = video.get("like_count") if video.get("like_count") is not None else 0
+    comment_count = video.get("comment_count") if video.get("comment_count") is not None else 0
+    upload_date = video.get("upload_date", "")  # YYYYMMDD
+
+    # Convert YYYYMMDD to YYYY-MM-DD
+    date_str = None
+    if upload_date and len(upload_date) == 8:
+        date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
+
+    description = str(video.get("description", ""))[:500]
+    return {
+        "video_id": video_id,
+        "title": video.get("title", ""),
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "channel_name": video.get("channel", video.get("uploader", "")),
+        "date": date_str,
+        "engagement": {
+            "views": view_count,
+            "likes": like_count,
+            "comments": comment_count,
+        },
+        "duration": video.get("duration"),
+        "relevance": _compute_relevance(core_topic, f"{video.get('title', '')} {description}"),
+        "why_relevant": f"YouTube: {video.get('title', core_topic)[:60]}",
+        "description": description,
+    }
+
+
 def search_youtube(
     topic: str,
     from_date: str,
@@ -213,86 +500,14 @@ def search_youtube(
 
     _log(f"Searching YouTube for '{core_topic}' (since {from_date}, count={count})")
 
-    # yt-dlp search with full metadata (no --flat-playlist so dates are real).
-    # NOTE: --dateafter intentionally omitted — YouTube search returns
-    # relevance-sorted results and strict date filtering returns 0 for
-    # evergreen topics. Python soft filter (below) handles date filtering.
-    cmd = [
-        "yt-dlp",
-        "--ignore-config",
-        "--no-cookies-from-browser",
-        f"ytsearch{count}:{core_topic}",
-        "--dump-json",
-        "--no-warnings",
-        "--no-download",
-    ]
-
-    preexec = os.setsid if hasattr(os, 'setsid') else None
-
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            preexec_fn=preexec,
-        )
-        try:
-            stdout, stderr = proc.communicate(timeout=120)
-        except subprocess.TimeoutExpired:
-            try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            _log("YouTube search timed out (120s)")
-            return {"items": [], "error": "Search timed out"}
-    except FileNotFoundError:
-        return {"items": [], "error": "yt-dlp not found"}
-
-    if not (stdout or "").strip():
+    videos, error = _search_sharded(f"ytsearch{count}:{core_topic}", count)
+    if error:
+        return {"items": [], "error": error}
+    if not videos:
         _log("YouTube search returned 0 results")
         return {"items": []}
 
-    # Parse JSON-per-line output
-    items = []
-    for line in stdout.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            video = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        video_id = video.get("id", "")
-        view_count = video.get("view_count") if video.get("view_count") is not None else 0
-        like_count = video.get("like_count") if video.get("like_count") is not None else 0
-        comment_count = video.get("comment_count") if video.get("comment_count") is not None else 0
-        upload_date = video.get("upload_date", "")  # YYYYMMDD
-
-        # Convert YYYYMMDD to YYYY-MM-DD
-        date_str = None
-        if upload_date and len(upload_date) == 8:
-            date_str = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-
-        description = str(video.get("description", ""))[:500]
-        items.append({
-            "video_id": video_id,
-            "title": video.get("title", ""),
-            "url": f"https://www.youtube.com/watch?v={video_id}",
-            "channel_name": video.get("channel", video.get("uploader", "")),
-            "date": date_str,
-            "engagement": {
-                "views": view_count,
-                "likes": like_count,
-                "comments": comment_count,
-            },
-            "duration": video.get("duration"),
-            "relevance": _compute_relevance(core_topic, f"{video.get('title', '')} {description}"),
-            "why_relevant": f"YouTube: {video.get('title', core_topic)[:60]}",
-            "description": description,
-        })
+    items = [_video_item(video, core_topic) for video in videos]
 
     # Soft date filter: prefer recent items but fall back to all if too few
     recent = [i for i in items if i["date"] and i["date"] >= from_date]
@@ -302,33 +517,72 @@ def search_youtube(
     else:
         _log(f"Found {len(items)} videos ({len(recent)} within date range, keeping all)")
 
-    # Sort by views descending
-    items.sort(key=lambda x: x["engagement"]["views"], reverse=True)
-
+    # Left in yt-dlp's order: search_and_transcribe ranks the merged results
+    # by views once, after deduping across queries.
     return {"items": items}
 
 
-def _clean_vtt(vtt_text: str) -> str:
-    """Convert VTT subtitle format to clean plaintext."""
-    # Strip VTT header
-    text = re.sub(r'^WEBVTT.*?\n\n', '', vtt_text, flags=re.DOTALL)
-    # Strip timestamps
-    text = re.sub(r'\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}.*\n', '', text)
-    # Strip position/alignment tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Strip cue numbers
-    text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
-    # Deduplicate overlapping lines
-    lines = text.strip().split('\n')
-    seen = set()
-    unique = []
+_VTT_TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}')
+_VTT_TAG_RE = re.compile(r'<[^>]+>')
+_VTT_CUE_NUMBER_RE = re.compile(r'\d+\s*$')
+
+
+def _clean_vtt(vtt_lines: Iterable[str], max_words: Optional[int] = None) -> str:
+    """Convert VTT subtitle lines to clean plaintext.
+
+    One pass over the lines: skips the header block, timing lines and cue
+    numbers, strips position/alignment tags, and drops the repeated lines
+    that overlapping auto-captions produce. With ``max_words``, stops
+    reading once the budget is exceeded and truncates with ``...``, so
+    callers streaming a file never read past what they keep.
+
+    YouTube auto-captions (``Kind: captions`` in the header) always put the
+    cue timing on a line of its own, so those lines are dropped without
+    running the timestamp regex.
+    """
+    lines = iter(vtt_lines)
+    first = next(lines, "")
+    auto_captions = False
+    if first.startswith("WEBVTT"):
+        # Header runs up to the first blank line
+        for line in lines:
+            if not line.rstrip("\r\n"):
+                break
+            if line.startswith("Kind: captions"):
+                auto_captions = True
+    else:
+        lines = itertools.chain((first,), lines)
+
+    unique: Dict[str, None] = {}
+    word_count = 0
     for line in lines:
+        if '-->' in line:
+            if auto_captions:
+                continue
+            timestamp = _VTT_TIMESTAMP_RE.search(line)
+            if timestamp:
+                line = line[:timestamp.start()]
+        if '<' in line:
+            line = _VTT_TAG_RE.sub('', line)
         stripped = line.strip()
-        if stripped and stripped not in seen:
-            seen.add(stripped)
-            unique.append(stripped)
-    return re.sub(r'\s+', ' ', ' '.join(unique)).strip()
+        if not stripped or stripped in unique or _VTT_CUE_NUMBER_RE.match(line):
+            continue
+        unique[stripped] = None
+        if max_words is not None:
+            word_count += len(stripped.split())
+            if word_count > max_words:
+                break
+
+    words = ' '.join(unique).split()
+    if max_words is not None and len(words) > max_words:
+        return ' '.join(words[:max_words]) + '...'
+    return ' '.join(words)
+
 
+_PLAYER_RESPONSE_RE = re.compile(
+    r'ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;(?:\s*var\s|\s*<\/script>)'
+)
+_PLAYER_RESPONSE_VAR_RE = re.compile(r'var\s+ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;')
 
 _YT_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
@@ -363,16 +617,10 @@ def _fetch_transcript_direct(video_id: str, timeout: int = 30) -> Optional[str]:
 
     # Step 2: Extract captions URL from ytInitialPlayerResponse
     # YouTube embeds this as a JS variable in the page HTML
-    match = re.search(
-        r'ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;(?:\s*var\s|\s*<\/script>)',
-        html,
-    )
+    match = _PLAYER_RESPONSE_RE.search(html)
     if not match:
         # Fallback: try the JSON embedded in the script tag
-        match = re.search(
-            r'var\s+ytInitialPlayerResponse\s*=\s*(\{.+?\})\s*;',
-            html,
-        )
+        match = _PLAYER_RESPONSE_VAR_RE.search(html)
     if not match:
         _log(f"Direct transcript: no ytInitialPlayerResponse found for {video_id}")
         return None
@@ -429,16 +677,57 @@ def _fetch_transcript_direct(video_id: str, timeout: int = 30) -> Optional[str]:
     return vtt_text
 
 
-def _fetch_transcript_ytdlp(video_id: str, temp_dir: str) -> Optional[str]:
-    """Fetch transcript using yt-dlp (original implementation).
+def _transcript_tmpdir() -> str:
+    """Return the process-wide scratch directory for yt-dlp subtitle files.
+
+    Created on first use and removed at exit; each batch works in its own
+    subdirectory beneath it.
+    """
+    global _transcript_root
+    if _transcript_root is None:
+        with _transcript_root_lock:
+            if _transcript_root is None:
+                root = tempfile.mkdtemp(prefix="last30days-yt-")
+                atexit.register(shutil.rmtree, root, ignore_errors=True)
+                _transcript_root = root
+    return _transcript_root
+
+
+def _fetch_transcripts_ytdlp(
+    video_ids: List[str],
+    temp_dir: Optional[str] = None,
+) -> Dict[str, Optional[str]]:
+    """Fetch transcripts for several videos with a single yt-dlp run.
+
+    yt-dlp walks the URL list itself, so the batch pays one interpreter and
+    import startup instead of one per video. In-process, captions are read
+    straight into memory; the binary writes them under ``temp_dir``.
 
     Args:
-        video_id: YouTube video ID
-        temp_dir: Temporary directory for subtitle files
+        video_ids: YouTube video IDs
+        temp_dir: Directory for subtitle files (default: a fresh
+            subdirectory of the shared scratch directory, removed afterwards)
 
     Returns:
-        Raw VTT text, or None if no captions available.
+        Dict mapping video_id to transcript text (or None when the captions
+        were empty) for the videos that had a subtitle file.
     """
+    urls = [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids]
+    yt_dlp = _ytdlp_api()
+    if yt_dlp is not None:
+        return _fetch_transcripts_api(yt_dlp, video_ids, urls)
+
+    if temp_dir is not None:
+        return _fetch_transcripts_binary(video_ids, urls, temp_dir)
+    batch_dir = tempfile.mkdtemp(dir=_transcript_tmpdir())
+    try:
+        return _fetch_transcripts_binary(video_ids, urls, batch_dir)
+    finally:
+        shutil.rmtree(batch_dir, ignore_errors=True)
+
+
+def _fetch_transcripts_binary(video_ids: List[str], urls: List[str], temp_dir: str) -> Dict[str, Optional[str]]:
+    """Run the yt-dlp binary over ``urls`` and read back the subtitles it wrote."""
     cmd = [
         "yt-dlp",
         "--ignore-config",
@@ -449,45 +738,124 @@ def _fetch_transcript_ytdlp(video_id: str, temp_dir: str) -> Optional[str]:
         "--skip-download",
         "--no-warnings",
         "-o", f"{temp_dir}/%(id)s",
-        f"https://www.youtube.com/watch?v={video_id}",
     ]
+    cmd.extend(urls)
 
     preexec = os.setsid if hasattr(os, 'setsid') else None
+    timeout = TRANSCRIPT_TIMEOUT + TRANSCRIPT_TIMEOUT_PER_VIDEO * len(video_ids)
 
-    try:
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            preexec_fn=preexec,
-        )
+    with _ytdlp_slots:
         try:
-            proc.communicate(timeout=30)
-        except subprocess.TimeoutExpired:
+            # Only the subtitle files matter; yt-dlp's output is never read.
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                preexec_fn=preexec,
+            )
             try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
-            except (ProcessLookupError, PermissionError, OSError):
-                proc.kill()
-            proc.wait(timeout=5)
-            return None
-    except FileNotFoundError:
-        return None
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _terminate(proc)
+                proc.wait(timeout=5)
+                # Keep whatever subtitles were written before the timeout.
+                _log(f"yt-dlp transcript batch timed out ({timeout}s)")
+        except FileNotFoundError:
+            return {}
+
+    return _read_transcripts(video_ids, temp_dir)
+
+
+def _fetch_transcripts_api(yt_dlp, video_ids: List[str], urls: List[str]) -> Dict[str, Optional[str]]:
+    """Fetch English auto-captions in-process without touching disk.
+
+    Extracts each video's info, then reads its ``automatic_captions`` VTT
+    track through yt-dlp's own opener and cleans it in memory. The batch
+    gets its own YoutubeDL (instances are not shared between threads) and
+    the binary's timeout; transcripts finished before it expires are kept.
+    """
+    transcripts: Dict[str, Optional[str]] = {}
+    lock = threading.Lock()
+    timed_out = threading.Event()
+
+    def _extract_all():
+        with yt_dlp.YoutubeDL(dict(_YDL_BASE_OPTS)) as ydl:
+            for vid, url in zip(video_ids, urls):
+                if timed_out.is_set():
+                    return
+                # Contain anything else yt-dlp raises to this video, as the
+                # subprocess does, so the rest of the batch still comes back.
+                try:
+                    vtt_text = _fetch_caption_api(yt_dlp, ydl, vid, url)
+                    if not vtt_text or not vtt_text.strip():
+                        continue
+                    transcript = _vtt_to_transcript(vtt_text.splitlines())
+                except Exception as exc:
+                    _log(f"Unexpected yt-dlp error for {vid}: {type(exc).__name__}: {exc}")
+                    continue
+                with lock:
+                    transcripts[vid] = transcript
+
+    timeout = TRANSCRIPT_TIMEOUT + TRANSCRIPT_TIMEOUT_PER_VIDEO * len(video_ids)
+    try:
+        _in_background(_extract_all).result(timeout=timeout)
+    except FuturesTimeoutError:
+        timed_out.set()
+        _log(f"yt-dlp transcript batch timed out ({timeout}s)")
+    with lock:
+        return dict(transcripts)
 
-    # yt-dlp may save as .en.vtt or .en-orig.vtt
-    vtt_path = Path(temp_dir) / f"{video_id}.en.vtt"
-    if not vtt_path.exists():
-        # Try alternate naming
-        for p in Path(temp_dir).glob(f"{video_id}*.vtt"):
-            vtt_path = p
-            break
-        else:
-            return None
 
+def _fetch_caption_api(yt_dlp, ydl, vid: str, url: str) -> Optional[str]:
+    """Return one video's English auto-caption VTT text, or None if it has none."""
     try:
-        return vtt_path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
+        info = ydl.extract_info(url, download=False)
+    except yt_dlp.utils.DownloadError as exc:
+        _log(f"yt-dlp info extraction failed for {vid}: {exc}")
+        return None
+    tracks = ((info or {}).get("automatic_captions") or {}).get("en") or []
+    vtt_url = next((t.get("url") for t in tracks if t.get("ext") == "vtt"), None)
+    if not vtt_url:
         return None
+    try:
+        with ydl.urlopen(vtt_url) as resp:
+            return resp.read().decode("utf-8", errors="replace")
+    except (yt_dlp.utils.YoutubeDLError, OSError) as exc:
+        _log(f"yt-dlp caption fetch failed for {vid}: {exc}")
+        return None
+
+
+def _read_transcripts(video_ids: List[str], temp_dir: str) -> Dict[str, Optional[str]]:
+    """Map the subtitle files yt-dlp wrote in temp_dir back to video ids.
+
+    Files are streamed through _clean_vtt with buffered reads, so a long
+    video's captions are only read up to the transcript word limit.
+    """
+    # yt-dlp may save as .en.vtt or .en-orig.vtt; prefer the plain .en track.
+    wanted = set(video_ids)
+    paths: Dict[str, str] = {}
+    with os.scandir(temp_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".vtt"):
+                continue
+            vid = name.split(".", 1)[0]
+            if vid in wanted and (vid not in paths or name == f"{vid}.en.vtt"):
+                paths[vid] = entry.path
+
+    transcripts = {}
+    for vid, path in paths.items():
+        try:
+            with open(path, encoding="utf-8", errors="replace", buffering=VTT_READ_BUFFER) as f:
+                transcripts[vid] = _vtt_to_transcript(f)
+        except OSError:
+            continue
+    return transcripts
+
+
+def _vtt_to_transcript(vtt_lines: Iterable[str]) -> Optional[str]:
+    """Clean VTT lines, truncated to TRANSCRIPT_MAX_WORDS."""
+    return _clean_vtt(vtt_lines, TRANSCRIPT_MAX_WORDS) or None
 
 
 def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
@@ -503,39 +871,42 @@ def fetch_transcript(video_id: str, temp_dir: str) -> Optional[str]:
     Returns:
         Plaintext transcript string, or None if no captions available.
     """
-    raw_vtt = None
     if is_ytdlp_installed():
-        raw_vtt = _fetch_transcript_ytdlp(video_id, temp_dir)
-        if not raw_vtt:
-            _log(f"yt-dlp transcript failed for {video_id}, trying direct HTTP fallback")
-            raw_vtt = _fetch_transcript_direct(video_id)
+        # Private subdirectory: concurrent callers sharing temp_dir never
+        # see each other's subtitle files when the result is scanned.
+        with tempfile.TemporaryDirectory(dir=temp_dir) as video_dir:
+            transcripts = _fetch_transcripts_ytdlp([video_id], video_dir)
+        if video_id in transcripts:
+            return transcripts[video_id]
+        _log(f"yt-dlp transcript failed for {video_id}, trying direct HTTP fallback")
     else:
         _log("yt-dlp not installed, using direct HTTP transcript fetch")
-        raw_vtt = _fetch_transcript_direct(video_id)
+    return _fetch_transcript_fallback(video_id)
+
 
+def _fetch_transcript_fallback(video_id: str) -> Optional[str]:
+    """Fetch one transcript over direct HTTP, for videos yt-dlp could not serve."""
+    raw_vtt = _fetch_transcript_direct(video_id)
     if not raw_vtt:
         _log(f"No transcript available for {video_id} (no captions found)")
         return None
-
-    transcript = _clean_vtt(raw_vtt)
-
-    # Truncate to max words
-    words = transcript.split()
-    if len(words) > TRANSCRIPT_MAX_WORDS:
-        transcript = ' '.join(words[:TRANSCRIPT_MAX_WORDS]) + '...'
-
-    return transcript if transcript else None
+    return _vtt_to_transcript(raw_vtt.splitlines())
 
 
 def fetch_transcripts_parallel(
     video_ids: List[str],
     max_workers: int = 5,
 ) -> Dict[str, Optional[str]]:
-    """Fetch transcripts for multiple videos in parallel.
+    """Fetch transcripts for multiple videos.
+
+    With yt-dlp installed, the videos are split into up to ``max_workers``
+    groups and each group goes through its own batched yt-dlp run, with the
+    runs in parallel. Videos yt-dlp could not serve (or every video, without
+    yt-dlp) fall back to direct HTTP fetches in parallel.
 
     Args:
         video_ids: List of YouTube video IDs
-        max_workers: Max parallel fetches
+        max_workers: Max parallel yt-dlp runs and direct HTTP fetches
 
     Returns:
         Dict mapping video_id to transcript text (or None).
@@ -545,18 +916,43 @@ def fetch_transcripts_parallel(
 
     _log(f"Fetching transcripts for {len(video_ids)} videos")
 
-    results = {}
-    with tempfile.TemporaryDirectory() as temp_dir:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    results: Dict[str, Optional[str]] = {}
+    if is_ytdlp_installed():
+        # Each group is a separate run with its own timeout and scratch
+        # subdirectory, so one slow video only holds up its own group.
+        group_size = math.ceil(len(video_ids) / max_workers)
+        groups = [
+            video_ids[start:start + group_size]
+            for start in range(0, len(video_ids), group_size)
+        ]
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(_fetch_transcripts_ytdlp, group) for group in groups]
+            for future in as_completed(futures):
+                try:
+                    results.update(future.result())
+                except (OSError, subprocess.SubprocessError) as exc:
+                    _log(f"yt-dlp transcript batch error: {exc}")
+                except Exception as exc:
+                    # The group's ids stay missing and go to the HTTP fallback.
+                    _log(f"Unexpected yt-dlp transcript batch error: {type(exc).__name__}: {exc}")
+        missing = [vid for vid in video_ids if vid not in results]
+        if missing:
+            _log(f"yt-dlp transcripts missing for {len(missing)} videos, trying direct HTTP fallback")
+    else:
+        _log("yt-dlp not installed, using direct HTTP transcript fetch")
+        missing = list(video_ids)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
             futures = {
-                executor.submit(fetch_transcript, vid, temp_dir): vid
-                for vid in video_ids
+                executor.submit(_fetch_transcript_fallback, vid): vid
+                for vid in missing
             }
             for future in as_completed(futures):
                 vid = futures[future]
                 try:
                     results[vid] = future.result()
-                except (OSError, subprocess.SubprocessError) as exc:
+                except OSError as exc:
                     _log(f"Transcript fetch error for {vid}: {exc}")
                     results[vid] = None
                 except Exception as exc:
@@ -569,6 +965,11 @@ def fetch_transcripts_parallel(
     return results
 
 
+def _views(item: Dict[str, Any]) -> int:
+    """Sort key: a search item's view count."""
+    return item.get("engagement", {}).get("views", 0)
+
+
 def search_and_transcribe(
     topic: str,
     from_date: str,
@@ -578,7 +979,8 @@ def search_and_transcribe(
     """Full YouTube search: find videos, then fetch transcripts for top results.
 
     Uses expand_youtube_queries() to generate multiple search queries,
-    runs yt-dlp for each, and merges/deduplicates results by video ID.
+    runs yt-dlp for each concurrently (within the module-wide yt-dlp cap),
+    and merges/deduplicates results by video ID.
 
     Args:
         topic: Search topic
@@ -589,20 +991,27 @@ def search_and_transcribe(
     Returns:
         Dict with 'items' list. Each item has a 'transcript_snippet' field.
     """
-    # Step 1: Multi-query search — run yt-dlp for each expanded query
+    # Step 1: Multi-query search — run yt-dlp for each expanded query.
+    # The queries are independent, so they run concurrently; results are
+    # merged in query order, exactly as a sequential loop would. Every
+    # yt-dlp run underneath takes a _ytdlp_slots slot, so the queries share
+    # the module-wide YTDLP_MAX_CONCURRENT cap with their search shards.
     queries = expand_youtube_queries(topic, depth)
-    seen_ids: Set[str] = set()
-    items: List[Dict[str, Any]] = []
-    for q in queries:
-        search_result = search_youtube(q, from_date, to_date, depth)
+    with ThreadPoolExecutor(max_workers=min(len(queries), YTDLP_MAX_CONCURRENT)) as executor:
+        search_results = list(executor.map(
+            lambda q: search_youtube(q, from_date, to_date, depth), queries,
+        ))
+    # Insertion-ordered dict keeps the first hit per video ID
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for search_result in search_results:
         for item in search_result.get("items", []):
             vid = item.get("video_id", "")
-            if vid and vid not in seen_ids:
-                seen_ids.add(vid)
-                items.append(item)
+            if vid:
+                by_id.setdefault(vid, item)
+    items = list(by_id.values())
 
     # Sort merged results by views descending
-    items.sort(key=lambda x: x.get("engagement", {}).get("views", 0), reverse=True)
+    items.sort(key=_views, reverse=True)
 
     if not items:
         return search_result
@@ -634,12 +1043,14 @@ def search_and_transcribe(
     return {"items": items}
 
 
-def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Parse YouTube search response to normalized format.
+def parse_youtube_response(response: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Parse YouTube search response to normalized format. Accepts None.
 
     Returns:
         List of item dicts ready for normalization.
     """
+    if not response:
+        return []
     return response.get("items", [])
 
 
@@ -649,11 +1060,6 @@ def parse_youtube_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 SCRAPECREATORS_YT_BASE = "https://api.scrapecreators.com/v1/youtube"
 
-try:
-    import requests as _requests
-except ImportError:
-    _requests = None
-
 
 def _total_engagement(item: Dict[str, Any]) -> int:
     """Combined engagement score for ranking which videos to enrich."""
@@ -687,12 +1093,9 @@ def enrich_with_comments(
     if not items or not token or max_videos <= 0:
         return items
 
-    ranked = sorted(items, key=_total_engagement, reverse=True)
-    top_items = ranked[:max_videos]
+    top_items = heapq.nlargest(max_videos, items, key=_total_engagement)
     _log(f"Enriching comments for {len(top_items)} YouTube videos")
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     def _enrich_one(item: dict) -> bool:
         video_id = item.get("video_id", "")
         if not video_id:
@@ -733,9 +1136,9 @@ def _fetch_video_comments(
         List of comment dicts with author, text, likes, date.
     """
     video_url = f"https://www.youtube.com/watch?v={video_id}"
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"url": video_url})
             url = f"{SCRAPECREATORS_YT_BASE}/video/comments?{params}"
             headers = http.scrapecreators_headers(token)
@@ -746,7 +1149,7 @@ def _fetch_video_comments(
             return []
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_YT_BASE}/video/comments",
                 params={"url": video_url},
                 headers=http.scrapecreators_headers(token),
@@ -915,9 +1318,9 @@ def _sc_youtube_search(keyword: str, token: str) -> List[Dict[str, Any]]:
     Returns:
         List of raw video dicts from the API.
     """
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"keyword": keyword})
             url = f"{SCRAPECREATORS_YT_BASE}/search?{params}"
             headers = http.scrapecreators_headers(token)
@@ -929,7 +1332,7 @@ def _sc_youtube_search(keyword: str, token: str) -> List[Dict[str, Any]]:
             return []
 
     try:
-        resp = _requests.get(
+        resp = session.get(
             f"{SCRAPECREATORS_YT_BASE}/search",
             params={"keyword": keyword},
             headers=http.scrapecreators_headers(token),
@@ -954,9 +1357,9 @@ def _sc_fetch_transcript(video_id: str, token: str) -> Optional[str]:
         Plaintext transcript string, or None if unavailable.
     """
     video_url = f"https://www.youtube.com/watch?v={video_id}"
-    if not _requests:
+    session = http.get_session()
+    if session is None:
         try:
-            from urllib.parse import urlencode
             params = urlencode({"url": video_url})
             url = f"{SCRAPECREATORS_YT_BASE}/video/transcript?{params}"
             headers = http.scrapecreators_headers(token)
@@ -967,7 +1370,7 @@ def _sc_fetch_transcript(video_id: str, token: str) -> Optional[str]:
             return None
     else:
         try:
-            resp = _requests.get(
+            resp = session.get(
                 f"{SCRAPECREATORS_YT_BASE}/video/transcript",
                 params={"url": video_url},
                 headers=http.scrapecreators_headers(token),
@@ -988,12 +1391,5 @@ def _sc_fetch_transcript(video_id: str, token: str) -> Optional[str]:
     if isinstance(transcript, list):
         transcript = " ".join(str(s) for s in transcript)
 
-    # Clean VTT formatting if present
-    transcript = _clean_vtt(transcript)
-
-    # Truncate to max words
-    words = transcript.split()
-    if len(words) > TRANSCRIPT_MAX_WORDS:
-        transcript = " ".join(words[:TRANSCRIPT_MAX_WORDS]) + "..."
-
-    return transcript if transcript else None
+    # Clean VTT formatting if present, truncated to max words
+    return _vtt_to_transcript(transcript.splitlines())
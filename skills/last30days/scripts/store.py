@@ -11,12 +11,14 @@ Database location: ~/.local/share/last30days/research.db
 """
 
 import argparse
+import itertools
 import json
+import os
 import sqlite3
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
@@ -34,6 +36,26 @@ def _get_db_path() -> Path:
     return _db_override or DB_PATH
 
 
+def _batch_size() -> int:
+    try:
+        return max(1, int(os.environ.get("LAST30DAYS_STORE_BATCH", "")))
+    except ValueError:
+        return 500
+
+
+# Rows per executemany()/IN (...) chunk. Large enough to amortize statement
+# overhead, small enough to stay under SQLite's bound-variable limit.
+STORE_BATCH = _batch_size()
+
+# SQLITE_MAX_VARIABLE_NUMBER on builds older than 3.32; newer ones allow more.
+SQLITE_MAX_VARIABLES = 999
+
+
+def _chunks(rows: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
 SCHEMA_V1 = """
 PRAGMA journal_mode=WAL;
 PRAGMA synchronous=NORMAL;
@@ -90,7 +112,6 @@ CREATE TABLE IF NOT EXISTS findings (
 
 CREATE INDEX IF NOT EXISTS idx_findings_topic ON findings(topic_id, first_seen);
 CREATE INDEX IF NOT EXISTS idx_findings_source ON findings(source, topic_id);
-CREATE INDEX IF NOT EXISTS idx_findings_url ON findings(source_url);
 
 CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
     content, summary, source_title, author,
@@ -159,7 +180,11 @@ _UPDATABLE_FINDING_COLUMNS = frozenset({
 })
 
 # Future migrations keyed by version number
-MIGRATIONS: Dict[int, str] = {}
+MIGRATIONS: Dict[int, str] = {
+    # source_url is UNIQUE, so SQLite already keeps an implicit index on it;
+    # the explicit one only doubled the index writes on every insert.
+    2: "DROP INDEX IF EXISTS idx_findings_url;",
+}
 
 
 def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
@@ -169,6 +194,7 @@ def _connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
@@ -340,66 +366,114 @@ def update_run(run_id: int, **kwargs):
 # --- Findings ---
 
 
+def _existing_findings(
+    conn: sqlite3.Connection,
+    urls: List[str],
+) -> Dict[str, sqlite3.Row]:
+    """Look up already-stored findings for ``urls``, one query per chunk. Keyed by URL."""
+    existing = {}
+    for chunk in _chunks(urls, min(STORE_BATCH, SQLITE_MAX_VARIABLES)):
+        placeholders = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            f"SELECT id, source_url, engagement_score FROM findings WHERE source_url IN ({placeholders})",
+            chunk,
+        ).fetchall()
+        existing.update((row["source_url"], row) for row in rows)
+    return existing
+
+
 def store_findings(
     run_id: int,
     topic_id: int,
     findings: List[Dict[str, Any]],
 ) -> Dict[str, int]:
-    """Store findings with URL-based dedup. Returns counts of new/updated."""
+    """Store findings with URL-based dedup. Returns counts of new/updated.
+
+    Existing URLs are looked up in bulk, updates go out as ``executemany``
+    batches and new rows as multi-row INSERT statements sized to SQLite's
+    bound-variable limit, all in one transaction. A URL repeated within
+    ``findings`` counts as a re-sighting, exactly as if it had been stored
+    by an earlier call.
+    """
     conn = _connect()
     new_count = 0
     updated_count = 0
 
     try:
+        urls = list(dict.fromkeys(
+            url for f in findings if (url := f.get("source_url") or f.get("url"))
+        ))
+        existing = _existing_findings(conn, urls)
+
+        # url -> [INSERT params]; sighting_count/engagement fold in repeats
+        inserts: Dict[str, List[Any]] = {}
+        # url -> [engagement_score, extra sightings, finding id]
+        updates: Dict[str, List[Any]] = {}
         for f in findings:
             url = f.get("source_url") or f.get("url")
             if not url:
                 continue
+            new_engagement = f.get("engagement_score", 0)
 
-            existing = conn.execute(
-                "SELECT id, engagement_score, sighting_count FROM findings WHERE source_url = ?",
-                (url,),
-            ).fetchone()
-
-            if existing:
+            if url in inserts:
+                # Re-sighted within this batch: bump the pending insert
+                row = inserts[url]
+                row[10] += 1
+                row[8] = max(new_engagement, row[8] or 0)
+                updated_count += 1
+            elif url in existing:
                 # Update engagement and re-sighting info
-                new_engagement = f.get("engagement_score", 0)
-                conn.execute(
-                    """UPDATE findings SET
-                           last_seen = datetime('now'),
-                           sighting_count = sighting_count + 1,
-                           engagement_score = ?,
-                           run_id = ?
-                       WHERE id = ?""",
-                    (
-                        max(new_engagement, existing["engagement_score"] or 0),
-                        run_id,
-                        existing["id"],
-                    ),
-                )
+                update = updates.get(url)
+                if update is None:
+                    update = updates[url] = [
+                        existing[url]["engagement_score"] or 0, 0, existing[url]["id"],
+                    ]
+                update[0] = max(new_engagement, update[0])
+                update[1] += 1
                 updated_count += 1
             else:
                 # New finding
-                conn.execute(
-                    """INSERT INTO findings
-                       (run_id, topic_id, source, source_url, source_title,
-                        author, content, summary, engagement_score, relevance_score)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        run_id,
-                        topic_id,
-                        f.get("source", "unknown"),
-                        url,
-                        f.get("source_title") or f.get("title", ""),
-                        f.get("author", ""),
-                        f.get("content") or f.get("text", ""),
-                        f.get("summary", ""),
-                        f.get("engagement_score", 0),
-                        f.get("relevance_score", 0),
-                    ),
-                )
+                inserts[url] = [
+                    run_id,
+                    topic_id,
+                    f.get("source", "unknown"),
+                    url,
+                    f.get("source_title") or f.get("title", ""),
+                    f.get("author", ""),
+                    f.get("content") or f.get("text", ""),
+                    f.get("summary", ""),
+                    new_engagement,
+                    f.get("relevance_score", 0),
+                    1,
+                ]
                 new_count += 1
 
+        update_rows = [
+            (sightings, engagement, run_id, finding_id)
+            for engagement, sightings, finding_id in updates.values()
+        ]
+        for chunk in _chunks(update_rows, STORE_BATCH):
+            conn.executemany(
+                """UPDATE findings SET
+                       last_seen = datetime('now'),
+                       sighting_count = sighting_count + ?,
+                       engagement_score = ?,
+                       run_id = ?
+                   WHERE id = ?""",
+                chunk,
+            )
+        row_placeholders = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        rows_per_insert = min(STORE_BATCH, SQLITE_MAX_VARIABLES // 11)
+        for chunk in _chunks(list(inserts.values()), rows_per_insert):
+            conn.execute(
+                """INSERT INTO findings
+                   (run_id, topic_id, source, source_url, source_title,
+                    author, content, summary, engagement_score, relevance_score,
+                    sighting_count)
+                   VALUES """ + ", ".join([row_placeholders] * len(chunk)),
+                list(itertools.chain.from_iterable(chunk)),
+            )
+
         # Update run stats
         conn.execute(
             "UPDATE research_runs SET findings_new = ?, findings_updated = ? WHERE id = ?",
@@ -645,6 +719,34 @@ def finding_from_candidate(candidate: schema.Candidate) -> Dict[str, Any]:
     }
 
 
+def finding_from_item(source: str, item: schema.SourceItem) -> Dict[str, Any]:
+    """Convert a raw source item into a persisted finding."""
+    body = item.body
+    return {
+        "source": source,
+        "source_url": item.url,
+        "source_title": item.title,
+        "author": item.author or "",
+        "content": body or "",
+        "summary": item.snippet or (body[:500] if body else ""),
+        "engagement_score": item.engagement_score or 0.0,
+        "relevance_score": item.local_relevance or 0.5,
+    }
+
+
+def _iter_supplemental_findings(
+    report: schema.Report,
+    seen_urls: set,
+):
+    """Yield HN/PM findings for items not already captured in ranked candidates."""
+    for source_name in ("hackernews", "polymarket"):
+        for item in report.items_by_source.get(source_name, ()):
+            if item.url in seen_urls:
+                continue  # Already captured with rich data
+            seen_urls.add(item.url)
+            yield finding_from_item(source_name, item)
+
+
 def findings_from_report(
     report: schema.Report,
     *,
@@ -656,36 +758,16 @@ def findings_from_report(
     Supplements with raw items from items_by_source for HN/PM that didn't rank highly
     but are valuable for watchlist persistence.
     """
-    findings = []
-    seen_urls = set()
-    
-    # Phase 1: Process ranked candidates (high-quality data with explanations and corroboration)
-    for candidate in report.ranked_candidates:
-        finding = finding_from_candidate(candidate)
-        findings.append(finding)
-        seen_urls.add(candidate.url)
-    
-    # Phase 2: Add HN/PM items not already captured in ranked candidates
-    for source_name in ["hackernews", "polymarket"]:
-        if source_name not in report.items_by_source:
-            continue
-        for item in report.items_by_source[source_name]:
-            if item.url in seen_urls:
-                continue  # Already captured with rich data
-            findings.append({
-                "source": source_name,
-                "source_url": item.url,
-                "source_title": item.title,
-                "author": item.author or "",
-                "content": item.body or "",
-                "summary": item.snippet or (item.body[:500] if item.body else ""),
-                "engagement_score": item.engagement_score or 0.0,
-                "relevance_score": item.local_relevance or 0.5,
-            })
-            seen_urls.add(item.url)
-    
-    # Apply global limit after collecting all findings (fix: was per-source, now global)
-    return findings[:limit] if limit is not None else findings
+    ranked = report.ranked_candidates
+    findings = itertools.chain(
+        # Phase 1: ranked candidates (high-quality data with explanations and corroboration)
+        (finding_from_candidate(candidate) for candidate in ranked),
+        # Phase 2: HN/PM items not already captured in ranked candidates
+        _iter_supplemental_findings(report, {candidate.url for candidate in ranked}),
+    )
+    # Apply global limit after collecting all findings (fix: was per-source, now global);
+    # islice stops before converting anything past the limit.
+    return list(itertools.islice(findings, limit))
 
 
 # --- CLI interface ---